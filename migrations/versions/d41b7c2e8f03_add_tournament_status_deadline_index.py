@@ -0,0 +1,26 @@
+"""add tournament (status, pick_deadline) index
+
+Revision ID: d41b7c2e8f03
+Revises: c368002569a2
+Create Date: 2026-08-29 10:14:22.503918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41b7c2e8f03'
+down_revision = 'c368002569a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tournament', schema=None) as batch_op:
+        batch_op.create_index('ix_tournament_status_deadline', ['status', 'pick_deadline'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tournament', schema=None) as batch_op:
+        batch_op.drop_index('ix_tournament_status_deadline')
@@ -0,0 +1,26 @@
+"""add pick (tournament_id, user_id) index
+
+Revision ID: e59ad1f7b2c4
+Revises: d41b7c2e8f03
+Create Date: 2026-08-29 14:03:41.118205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e59ad1f7b2c4'
+down_revision = 'd41b7c2e8f03'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('pick', schema=None) as batch_op:
+        batch_op.create_index('ix_pick_tournament_user', ['tournament_id', 'user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('pick', schema=None) as batch_op:
+        batch_op.drop_index('ix_pick_tournament_user')
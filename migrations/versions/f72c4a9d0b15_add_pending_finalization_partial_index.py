@@ -0,0 +1,29 @@
+"""add tournament pending-finalization partial index
+
+Revision ID: f72c4a9d0b15
+Revises: e59ad1f7b2c4
+Create Date: 2026-08-29 14:41:09.662174
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f72c4a9d0b15'
+down_revision = 'e59ad1f7b2c4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tournament', schema=None) as batch_op:
+        batch_op.create_index(
+            'ix_tournament_pending_finalization', ['end_date'], unique=False,
+            sqlite_where=sa.text("status = 'complete' AND results_finalized = 0"),
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('tournament', schema=None) as batch_op:
+        batch_op.drop_index('ix_tournament_pending_finalization')
@@ -137,6 +137,33 @@ class User(UserMixin, db.Model):
         self.total_points = total
         return total
 
+    @classmethod
+    def recalculate_total_points(cls, user_ids):
+        """Batch version of calculate_total_points.
+
+        One grouped aggregate plus one executemany UPDATE for the given
+        users, instead of a SUM query per user. Users with no qualifying
+        picks are reset to 0.
+        """
+        from sqlalchemy import func as sqla_func, update as sqla_update
+        user_ids = list(user_ids)
+        if not user_ids:
+            return
+        rows = db.session.query(
+            Pick.user_id,
+            sqla_func.coalesce(sqla_func.sum(Pick.points_earned), 0)
+        ).filter(
+            Pick.user_id.in_(user_ids),
+            Pick.points_earned.isnot(None)
+        ).join(Tournament).filter(
+            Tournament.status == 'complete'
+        ).group_by(Pick.user_id).all()
+        totals = dict(rows)
+        db.session.execute(
+            sqla_update(cls),
+            [{"id": uid, "total_points": totals.get(uid, 0)} for uid in user_ids],
+        )
+
     def penalty_owed(self, season_year):
         """Total $ owed from penalty-triggered picks for the given season."""
         from sqlalchemy import func as sqla_func
@@ -229,6 +256,14 @@ class Tournament(db.Model):
 
     __table_args__ = (
         db.UniqueConstraint('api_tourn_id', 'season_year', name='unique_tournament_per_season'),
+        # Serves the hourly reminder lookup: next non-complete tournament by deadline
+        db.Index('ix_tournament_status_deadline', 'status', 'pick_deadline'),
+        # Partial index matching the pending-finalization lookup exactly
+        # (complete but earnings not yet finalized, newest first)
+        db.Index(
+            'ix_tournament_pending_finalization', 'end_date',
+            sqlite_where=db.text("status = 'complete' AND results_finalized = 0"),
+        ),
     )
 
     def is_deadline_passed(self):
@@ -449,9 +484,12 @@ class Pick(db.Model):
     backup_player = db.relationship('Player', foreign_keys=[backup_player_id], backref='backup_picks')
     active_player = db.relationship('Player', foreign_keys=[active_player_id], backref='active_picks')
 
-    # Unique constraint: one pick per user per tournament
+    # Unique constraint: one pick per user per tournament.
+    # Composite index serves the pick-processing access path
+    # (filter by tournament, group work by user).
     __table_args__ = (
         db.UniqueConstraint('user_id', 'tournament_id', name='unique_user_tournament_pick'),
+        db.Index('ix_pick_tournament_user', 'tournament_id', 'user_id'),
     )
 
     def validate_availability(self, season_year: int):
@@ -24,15 +24,20 @@ PythonAnywhere Scheduled Task:
   cd /home/GolfPickEm/Golf_Pick_Em && ./run_reminders.sh
 """
 
+import logging
 import os
+import string
 import sys
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
+from functools import lru_cache
 from html import escape as _esc  # escape dynamic text before it enters email markup
-import pytz
+from zoneinfo import ZoneInfo
 
 # Add project path for PythonAnywhere
 PROJECT_HOME = '/home/GolfPickEm/Golf_Pick_Em'
@@ -42,9 +47,36 @@ if PROJECT_HOME not in sys.path:
 # Set environment
 os.environ.setdefault('FLASK_ENV', 'production')
 
-from flask import has_app_context
-from app import app
-from models import db, User, Tournament, TournamentField, TournamentResult, Pick, format_score_to_par
+# Buffered logging instead of per-line print() syscalls — the send loops
+# emit one line per recipient, and PythonAnywhere's log stream is a pipe.
+# Per-email success lines sit at DEBUG so production runs skip them.
+logger = logging.getLogger("reminders")
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+# The Flask app and ORM models are imported lazily via _load_orm() — the
+# hourly cron usually exits within milliseconds (missing config, no active
+# window), and the Flask/SQLAlchemy import chain dominates that startup.
+_ORM_LOADED = False
+
+
+def _load_orm():
+    """Bind the Flask app and models into module globals on first use.
+
+    Called at the top of every entry point that touches the database. The
+    pure email builders (and tests that exercise them) never pay for the
+    Flask import chain.
+    """
+    global _ORM_LOADED, has_app_context, app, db, User, Tournament
+    global TournamentField, TournamentResult, Pick, format_score_to_par
+    if _ORM_LOADED:
+        return
+    from flask import has_app_context
+    from app import app
+    from models import (
+        db, User, Tournament, TournamentField, TournamentResult, Pick,
+        format_score_to_par,
+    )
+    _ORM_LOADED = True
 
 
 @contextmanager
@@ -68,10 +100,10 @@ try:
     )
     CONFIG_LOADED = True
 except ImportError:
-    print("=" * 60)
-    print("ERROR: email_config.py not found!")
-    print("Copy email_config_template.py to email_config.py and configure it.")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("ERROR: email_config.py not found!")
+    logger.info("Copy email_config_template.py to email_config.py and configure it.")
+    logger.info("=" * 60)
     CONFIG_LOADED = False
     EMAIL_ADDRESS = ""
     EMAIL_PASSWORD = ""
@@ -80,14 +112,16 @@ except ImportError:
     SITE_URL = "https://golfpickem.pythonanywhere.com"
     COMMISSIONER_NAME = "The Commissioner"
 
-# Timezone
-CENTRAL_TZ = pytz.timezone("America/Chicago")
+# Timezone — stdlib zoneinfo (no pytz localize() step; attach with replace())
+CENTRAL_TZ = ZoneInfo("America/Chicago")
 
 # Minimum field size required for notifications
 MIN_FIELD_SIZE = 50
 
-# Admin contact for alerts
+# Admin contact for alerts — a comma-separated string expands to a list so
+# one message (one SMTP DATA payload) reaches every admin.
 ADMIN_EMAIL = "bhagstrom0@gmail.com"
+ADMIN_EMAILS = [e.strip() for e in ADMIN_EMAIL.split(",") if e.strip()]
 ADMIN_NAME = "Sun Day Regrets"
 
 # Reminder windows (hours before deadline)
@@ -99,6 +133,10 @@ REMINDER_WINDOWS = [
 
 # Tolerance window (minutes) - send reminder if within this window of the target time
 TOLERANCE_MINUTES = 35
+TOLERANCE_TD = timedelta(minutes=TOLERANCE_MINUTES)  # built once, not per check
+
+# Concurrent send workers — stays well under Gmail's concurrent connection cap
+SMTP_MAX_WORKERS = 5
 
 # ============================================================================
 # Inline style constants — Gmail-safe, no <style> blocks
@@ -281,27 +319,36 @@ def is_field_ready(tournament_id, minimum=MIN_FIELD_SIZE):
     return get_field_count(tournament_id) >= minimum
 
 
-def get_upcoming_tournament_for_reminders():
+def get_upcoming_tournament_for_reminders(now=None):
     """
     Find the next tournament that:
     - Has a pick_deadline in the future
     - Has a deadline within the next 24 hours + tolerance (for reminders)
-    - Has a synced field (≥50 players)
     - Is NOT already complete
 
     NOTE: We intentionally do NOT filter on status == 'upcoming' because
     the tournament can flip to 'active' (via start_date) before the
     pick deadline. Reminders should keep firing until the deadline passes.
 
+    The field-readiness gate (≥50 players) lives in main() — it only
+    matters once a reminder window is actually active, so the field COUNT
+    isn't paid on the 23-of-24 hourly runs that exit here.
+
     Returns:
         Tuple of (tournament, aware_deadline) or (None, None)
     """
-    now = get_current_time()
-    max_future = now + timedelta(hours=24, minutes=TOLERANCE_MINUTES)
+    now = now or get_current_time()
+    # Deadlines are stored as naive CT in SQLite, so the window bounds are
+    # naive CT too — the whole filter runs in SQL against the
+    # (status, pick_deadline) index and returns 0 or 1 rows.
+    now_naive = now.replace(tzinfo=None)
+    max_future = now_naive + timedelta(hours=24, minutes=TOLERANCE_MINUTES)
 
     tournament = Tournament.query.filter(
         Tournament.status != 'complete',
-        Tournament.pick_deadline.isnot(None)
+        Tournament.pick_deadline.isnot(None),
+        Tournament.pick_deadline > now_naive,
+        Tournament.pick_deadline <= max_future,
     ).order_by(Tournament.pick_deadline).first()
 
     if not tournament:
@@ -309,56 +356,53 @@ def get_upcoming_tournament_for_reminders():
 
     deadline = tournament.pick_deadline
     if deadline.tzinfo is None:
-        deadline = CENTRAL_TZ.localize(deadline)
-
-    if deadline <= now:
-        return None, None
-
-    if deadline > max_future:
-        return None, None
-
-    if not is_field_ready(tournament.id):
-        print(f"⚠️ Field not ready for {tournament.name} ({get_field_count(tournament.id)} players)")
-        print(f"   Reminders will not be sent until field has ≥{MIN_FIELD_SIZE} players")
-        return None, None
+        deadline = deadline.replace(tzinfo=CENTRAL_TZ)
 
     return tournament, deadline
 
 
 def get_users_without_picks(tournament_id):
-    """Get users who haven't made a pick for this tournament."""
-    all_users = User.query.all()
-    picked_user_ids = {
-        p.user_id for p in Pick.query.filter_by(tournament_id=tournament_id)
-    }
-    return [u for u in all_users if u.id not in picked_user_ids]
+    """Get users who haven't made a pick for this tournament.
 
+    Uses a single NOT EXISTS anti-join so the database filters the rows —
+    only users who actually need a reminder are materialized. Only the
+    columns the reminder emails actually read are loaded; the rest
+    (password hash, payment flags) stay deferred.
+    """
+    from sqlalchemy.orm import load_only
+    return User.query.options(
+        load_only(User.id, User.username, User.email, User.display_name, User.total_points)
+    ).filter(
+        ~User.picks.any(Pick.tournament_id == tournament_id)
+    ).all()
 
-def should_send_reminder(deadline, window_hours):
-    """Check if we should send a reminder for this window."""
-    now = get_current_time()
+
+def should_send_reminder(deadline, window_hours, now=None):
+    """Check if we should send a reminder for this window.
+
+    Pass ``now`` to reuse a single clock read across checks; defaults to
+    the current time for standalone calls.
+    """
+    now = now or get_current_time()
     target_time = deadline - timedelta(hours=window_hours)
-    window_start = target_time - timedelta(minutes=TOLERANCE_MINUTES)
-    window_end = target_time + timedelta(minutes=TOLERANCE_MINUTES)
-    return window_start <= now <= window_end
+    return abs(now - target_time) <= TOLERANCE_TD
 
 
-def get_active_reminder_window(deadline):
+def get_active_reminder_window(deadline, now=None):
     """Determine which reminder window (if any) is currently active."""
-    now = get_current_time()
+    now = now or get_current_time()
     if deadline <= now:
         return None
     for window in REMINDER_WINDOWS:
-        if should_send_reminder(deadline, window['hours']):
+        if should_send_reminder(deadline, window['hours'], now):
             return window
     return None
 
 
-def format_time_remaining(deadline):
-    """Format time remaining with clean rounding."""
-    now = get_current_time()
-    delta = deadline - now
-    total_hours = delta.total_seconds() / 3600
+@lru_cache(maxsize=128)
+def _format_remaining(total_minutes: int) -> str:
+    """Format a minute count with clean rounding (pure, cacheable)."""
+    total_hours = total_minutes / 60
 
     if total_hours >= 36:
         days = round(total_hours / 24)
@@ -371,10 +415,21 @@ def format_time_remaining(deadline):
     elif total_hours >= 0.75:
         return "1 hour"
     else:
-        minutes = max(1, round(total_hours * 60))
+        minutes = max(1, total_minutes)
         return f"{minutes} minutes"
 
 
+def format_time_remaining(deadline, now=None):
+    """Format time remaining with clean rounding.
+
+    Buckets the delta to whole minutes so repeated calls within the same
+    minute hit the lru_cache instead of redoing the rounding math.
+    """
+    now = now or get_current_time()
+    total_minutes = int((deadline - now).total_seconds() // 60)
+    return _format_remaining(total_minutes)
+
+
 def get_time_remaining_display(window):
     """Return a clean, rounded time-remaining string based on the reminder window."""
     display_map = {
@@ -389,36 +444,148 @@ def get_time_remaining_display(window):
 # Email Sending
 # ============================================================================
 
-def send_email(to_addr: str, subject: str, body: str, html_body: str = None) -> bool:
-    """Send an email with plain text and optional HTML body."""
-    if not EMAIL_ADDRESS or not EMAIL_PASSWORD:
-        print(f"  ❌ Cannot send to {to_addr}: Email credentials not configured")
-        return False
+# Constant From header — built once, not re-formatted per recipient in the
+# bulk send loops. (Bodies are personalized, so the MIME parts themselves
+# must still be built per recipient.)
+_FROM_HEADER = f"{COMMISSIONER_NAME} <{EMAIL_ADDRESS}>"
 
-    msg = MIMEMultipart('alternative')
-    msg["From"] = f"{COMMISSIONER_NAME} <{EMAIL_ADDRESS}>"
-    msg["To"] = to_addr
-    msg["Subject"] = subject
 
-    # Plain text first (lowest priority in 'alternative')
-    msg.attach(MIMEText(body, "plain"))
+@contextmanager
+def smtp_connection():
+    """Open one authenticated SMTP connection for a whole batch of sends.
+
+    Opening a fresh connection per email costs a TCP handshake + TLS
+    negotiation + AUTH roundtrip per recipient; reusing one connection pays
+    that once per batch. Yields None when the connection can't be
+    established — send_email() then falls back to per-message connections.
+    """
+    server = None
+    if EMAIL_ADDRESS and EMAIL_PASSWORD:
+        try:
+            server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
+            server.ehlo()
+            server.starttls()
+            server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
+        except Exception as e:
+            logger.warning(f"  ⚠️ Shared SMTP connection unavailable ({e}); using per-email connections")
+            server = None
+    try:
+        yield server
+    finally:
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+
+def send_email(to_addr, subject: str, body: str, html_body: str = None,
+               server: smtplib.SMTP = None) -> bool:
+    """Send an email with plain text and optional HTML body.
+
+    ``to_addr`` may be a single address or a list — a list delivers one
+    identical message to every recipient in a single SMTP transaction
+    (one DATA payload instead of N). Member emails are personalized, so
+    they still send one message per recipient.
+
+    Pass a connection from smtp_connection() to reuse it across a batch;
+    without one, a fresh connection is opened for this message.
+    """
+    if isinstance(to_addr, (list, tuple)):
+        to_addr = ", ".join(to_addr)
+
+    if not EMAIL_ADDRESS or not EMAIL_PASSWORD:
+        logger.error(f"  ❌ Cannot send to {to_addr}: Email credentials not configured")
+        return False
 
-    # HTML second (highest priority — email clients prefer this)
     if html_body:
+        msg = MIMEMultipart('alternative')
+        # Plain text first (lowest priority in 'alternative'), HTML second
+        # (highest priority — email clients prefer this)
+        msg.attach(MIMEText(body, "plain"))
         msg.attach(MIMEText(html_body, "html"))
+    else:
+        # Plain-text-only emails (admin alerts) skip the multipart wrapper —
+        # no boundary overhead for a single part.
+        msg = MIMEText(body, "plain")
+    msg["From"] = _FROM_HEADER
+    msg["To"] = to_addr
+    msg["Subject"] = subject
 
     try:
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
-            server.send_message(msg)
-        print(f"  ✅ Email sent to {to_addr}")
+        if server is not None:
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Shared connection dropped mid-batch — retry this message
+                # on a fresh one-shot connection rather than losing it.
+                with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as fresh:
+                    fresh.starttls()
+                    fresh.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
+                    fresh.send_message(msg)
+        else:
+            with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as fresh:
+                fresh.starttls()
+                fresh.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
+                fresh.send_message(msg)
+        logger.debug(f"  ✅ Email sent to {to_addr}")
         return True
     except Exception as e:
-        print(f"  ❌ Failed to send to {to_addr}: {e}")
+        logger.error(f"  ❌ Failed to send to {to_addr}: {e}")
         return False
 
 
+def send_emails_concurrent(messages, max_workers: int = SMTP_MAX_WORKERS) -> int:
+    """Send a batch of (to_addr, subject, plain, html) tuples concurrently.
+
+    Each worker thread keeps its own authenticated SMTP connection (SMTP
+    sessions are not thread-safe), so after the first message per worker the
+    cost is one send roundtrip rather than a full handshake + AUTH. Messages
+    must be plain tuples of primitives — no ORM objects cross threads.
+
+    Returns the number of emails sent successfully.
+    """
+    if not messages:
+        return 0
+
+    local = threading.local()
+    connections = []
+    connections_lock = threading.Lock()
+
+    def _get_server():
+        if not hasattr(local, 'server'):
+            server = None
+            if EMAIL_ADDRESS and EMAIL_PASSWORD:
+                try:
+                    server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
+                    server.ehlo()
+                    server.starttls()
+                    server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
+                    with connections_lock:
+                        connections.append(server)
+                except Exception as e:
+                    logger.warning(f"  ⚠️ Worker SMTP connection unavailable ({e}); using per-email connections")
+                    server = None
+            local.server = server
+        return local.server
+
+    def _send_one(msg_tuple):
+        to_addr, subject, plain, html = msg_tuple
+        return send_email(to_addr, subject, plain, html_body=html, server=_get_server())
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(messages))) as executor:
+            results = list(executor.map(_send_one, messages))
+    finally:
+        for server in connections:
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+    return sum(1 for ok in results if ok)
+
+
 # =============================================================================
 # PICKS OPEN NOTIFICATION (Called from sync_api.py after field sync)
 # =============================================================================
@@ -441,28 +608,29 @@ def send_picks_open_email(tournament_id_or_obj) -> int:
     Send "Picks Are Open" notification to all users.
     Called from sync_api.py after successful field sync.
     """
+    _load_orm()
     if isinstance(tournament_id_or_obj, int):
         tournament_id = tournament_id_or_obj
     else:
         tournament_id = tournament_id_or_obj.id
 
-    print(f"\n📬 Sending 'Picks Are Open' notifications...")
+    logger.info(f"\n📬 Sending 'Picks Are Open' notifications...")
 
     if not CONFIG_LOADED:
-        print("  ❌ Cannot send: Email configuration not loaded")
+        logger.error("  ❌ Cannot send: Email configuration not loaded")
         return 0
 
     with _app_context():
         tournament = db.session.get(Tournament, tournament_id)
         if not tournament:
-            print(f"  ❌ Tournament ID {tournament_id} not found")
+            logger.error(f"  ❌ Tournament ID {tournament_id} not found")
             return 0
 
-        print(f"  Tournament: {tournament.name}")
+        logger.info(f"  Tournament: {tournament.name}")
 
         deadline = tournament.pick_deadline
         if deadline and deadline.tzinfo is None:
-            deadline = CENTRAL_TZ.localize(deadline)
+            deadline = deadline.replace(tzinfo=CENTRAL_TZ)
         deadline_str = deadline.strftime('%A, %B %d at %I:%M %p CT') if deadline else "TBD"
 
         pick_url = f"{SITE_URL}/pick/{tournament.id}"
@@ -471,15 +639,20 @@ def send_picks_open_email(tournament_id_or_obj) -> int:
         tournament_name = tournament.name
         purse = tournament.purse
 
-        users = User.query.all()
+        # Stream users in batches instead of materializing the whole table —
+        # the first email goes out as soon as the first batch arrives.
+        users = User.query.yield_per(100)
         success_count = 0
+        total_users = 0
 
-        for user in users:
-            display_name = user.get_display_name()
-            user_email = user.email
+        with smtp_connection() as server:
+            for user in users:
+                total_users += 1
+                display_name = user.get_display_name()
+                user_email = user.email
 
-            # Plain text
-            plain = f"""Hi {display_name},
+                # Plain text
+                plain = f"""Hi {display_name},
 
 The field for {tournament_name} is now available, and picks are open!
 
@@ -502,16 +675,16 @@ Golf Pick 'Em {season_year}
 {SITE_URL}
 """
 
-            # HTML
-            html = _build_picks_open_html(
-                display_name, tournament_name, purse,
-                deadline_str, pick_url, season_year
-            )
+                # HTML
+                html = _build_picks_open_html(
+                    display_name, tournament_name, purse,
+                    deadline_str, pick_url, season_year
+                )
 
-            if send_email(user_email, subject, plain, html_body=html):
-                success_count += 1
+                if send_email(user_email, subject, plain, html_body=html, server=server):
+                    success_count += 1
 
-        print(f"\n📊 Picks Open Summary: {success_count}/{len(users)} emails sent")
+        logger.info(f"\n📊 Picks Open Summary: {success_count}/{total_users} emails sent")
         return success_count
 
 
@@ -519,18 +692,63 @@ Golf Pick 'Em {season_year}
 # DEADLINE REMINDER EMAILS
 # =============================================================================
 
+# Static plain-text urgency snippets, keyed by reminder window type —
+# allocated once at import rather than rebuilt for every recipient.
+_URGENCY_PLAIN = {
+    'final': """This is the last reminder. The deadline is almost here —
+make your pick before the gate closes.
+
+""",
+    'reminder': """About 12 hours left. One more reminder will go out
+1 hour before the deadline.
+
+""",
+    'warning': """About 24 hours left. Reminders will also go out
+at 12 hours and 1 hour before the deadline.
+
+""",
+}
+
+# Plain-text reminder body, compiled once at import. The literal structure
+# (and the static commissioner/site footer) is parsed a single time;
+# per-recipient calls only substitute the dynamic fields. Keeping the body
+# as a Template also leaves the door open to loading it from disk later.
+_REMINDER_PLAIN_TPL = string.Template(f"""Hi $name,
+
+You haven't made your pick for $tournament yet!
+
+Tournament: $tournament
+Purse: $purse
+Deadline: $deadline
+Time Remaining: $time_remaining
+
+Make your pick now: $pick_url
+
+${{urgency_note}}Good luck!
+{COMMISSIONER_NAME}
+
+---
+Golf Pick 'Em $season_year
+{SITE_URL}
+""")
+
+
 def build_reminder_email(user_display_name, user_total_points, user_golfers_used,
                          tournament_name, tournament_id, tournament_purse, tournament_season_year,
-                         deadline, window):
+                         deadline, window, deadline_str=None):
     """
     Build the email subject, plain-text body, and HTML body for a deadline reminder.
 
+    Pass ``deadline_str`` to reuse one formatted deadline across a batch;
+    it is derived from ``deadline`` when omitted.
+
     Returns:
         Tuple of (subject, plain_body, html_body)
     """
     time_remaining = get_time_remaining_display(window)
     pick_url = f"{SITE_URL}/pick/{tournament_id}"
-    deadline_str = deadline.strftime('%A, %B %d at %I:%M %p %Z')
+    if deadline_str is None:
+        deadline_str = deadline.strftime('%A, %B %d at %I:%M %p %Z')
 
     # Subject line based on urgency
     if window['type'] == 'final':
@@ -541,41 +759,18 @@ def build_reminder_email(user_display_name, user_total_points, user_golfers_used
         subject = f"{tournament_name} — picks close in ~24 hours"
 
     # --- Plain text body ---
-    plain = f"""Hi {user_display_name},
-
-You haven't made your pick for {tournament_name} yet!
-
-Tournament: {tournament_name}
-Purse: ${tournament_purse:,}
-Deadline: {deadline_str}
-Time Remaining: {time_remaining}
-
-Make your pick now: {pick_url}
-
-"""
-    if window['type'] == 'final':
-        plain += """This is the last reminder. The deadline is almost here —
-make your pick before the gate closes.
-
-"""
-    elif window['type'] == 'reminder':
-        plain += """About 12 hours left. One more reminder will go out
-1 hour before the deadline.
-
-"""
-    else:
-        plain += """About 24 hours left. Reminders will also go out
-at 12 hours and 1 hour before the deadline.
-
-"""
-
-    plain += f"""Good luck!
-{COMMISSIONER_NAME}
-
----
-Golf Pick 'Em {tournament_season_year}
-{SITE_URL}
-"""
+    # One substitute() against the precompiled module-level Template; the
+    # static urgency snippet comes from the module-level table.
+    plain = _REMINDER_PLAIN_TPL.substitute(
+        name=user_display_name,
+        tournament=tournament_name,
+        purse=f"${tournament_purse:,}",
+        deadline=deadline_str,
+        time_remaining=time_remaining,
+        pick_url=pick_url,
+        urgency_note=_URGENCY_PLAIN.get(window['type'], _URGENCY_PLAIN['warning']),
+        season_year=tournament_season_year,
+    )
 
     # --- HTML body ---
     # The countdown is the hero; the tier reads through color, never a siren.
@@ -632,26 +827,58 @@ def send_admin_field_alert(tournament_id_or_obj, field_count: int) -> bool:
     else:
         tournament_id = tournament_id_or_obj.id
 
-    print(f"\n🚨 Sending admin alert...")
+    return send_admin_field_alerts([(tournament_id, field_count)])
+
+
+def send_admin_field_alerts(alerts) -> bool:
+    """Send ONE admin alert covering every tournament with a short field.
+
+    Args:
+        alerts: List of (tournament_id, field_count) tuples collected during
+                the Wednesday field sync pass.
+
+    One email and one SMTP transaction regardless of how many tournaments
+    are failing — easier inbox triage than one ping per event.
+    """
+    if not alerts:
+        return False
+
+    logger.info(f"\n🚨 Sending admin alert...")
 
     if not CONFIG_LOADED:
-        print("  ❌ Cannot send: Email configuration not loaded")
+        logger.error("  ❌ Cannot send: Email configuration not loaded")
         return False
 
+    _load_orm()
     with _app_context():
-        tournament = db.session.get(Tournament, tournament_id)
-        if not tournament:
-            print(f"  ❌ Tournament ID {tournament_id} not found")
-            return False
-
-        print(f"  Tournament: {tournament.name}")
+        sections = []
+        names = []
+        for tournament_id, field_count in alerts:
+            tournament = db.session.get(Tournament, tournament_id)
+            if not tournament:
+                logger.error(f"  ❌ Tournament ID {tournament_id} not found")
+                continue
+
+            logger.info(f"  Tournament: {tournament.name}")
+
+            deadline = tournament.pick_deadline
+            if deadline and deadline.tzinfo is None:
+                deadline = deadline.replace(tzinfo=CENTRAL_TZ)
+            deadline_str = deadline.strftime('%A, %B %d at %I:%M %p CT') if deadline else "TBD"
+
+            names.append(tournament.name)
+            sections.append(f"""Tournament: {tournament.name}
+Current Field Size: {field_count} players (minimum required: {MIN_FIELD_SIZE})
+Pick Deadline: {deadline_str}
+Tournament Start: {tournament.start_date.strftime('%A, %B %d')}""")
 
-        deadline = tournament.pick_deadline
-        if deadline and deadline.tzinfo is None:
-            deadline = CENTRAL_TZ.localize(deadline)
-        deadline_str = deadline.strftime('%A, %B %d at %I:%M %p CT') if deadline else "TBD"
+        if not sections:
+            return False
 
-        subject = f"⚠️ ADMIN ALERT: Field sync issue for {tournament.name}"
+        if len(names) == 1:
+            subject = f"⚠️ ADMIN ALERT: Field sync issue for {names[0]}"
+        else:
+            subject = f"⚠️ ADMIN ALERT: Field sync issues for {len(names)} tournaments"
 
         body = f"""Hi {ADMIN_NAME},
 
@@ -659,10 +886,7 @@ This is an automated alert from Golf Pick 'Em.
 
 ⚠️ FIELD SYNC ISSUE DETECTED
 
-Tournament: {tournament.name}
-Current Field Size: {field_count} players (minimum required: {MIN_FIELD_SIZE})
-Pick Deadline: {deadline_str}
-Tournament Start: {tournament.start_date.strftime('%A, %B %d')}
+""" + "\n\n---\n\n".join(sections) + f"""
 
 What this means:
 • The Wednesday field confirmation pass did not find enough players
@@ -684,7 +908,7 @@ This alert will only be sent once per tournament.
 Golf Pick 'Em Automated Alert System
 """
 
-        return send_email(ADMIN_EMAIL, subject, body)
+        return send_email(ADMIN_EMAILS, subject, body)
 
 
 # =============================================================================
@@ -702,19 +926,20 @@ def send_results_recap_email(tournament_id: int) -> int:
     Returns:
         Number of emails successfully sent
     """
-    print(f"\n📊 Sending Results Recap emails...")
+    logger.info(f"\n📊 Sending Results Recap emails...")
 
     if not CONFIG_LOADED:
-        print("  ❌ Cannot send: Email configuration not loaded")
+        logger.error("  ❌ Cannot send: Email configuration not loaded")
         return 0
 
+    _load_orm()
     with _app_context():
         tournament = db.session.get(Tournament, tournament_id)
         if not tournament:
-            print(f"  ❌ Tournament ID {tournament_id} not found")
+            logger.error(f"  ❌ Tournament ID {tournament_id} not found")
             return 0
 
-        print(f"  Tournament: {tournament.name}")
+        logger.info(f"  Tournament: {tournament.name}")
 
         season_year = tournament.season_year
         tournament_name = tournament.name
@@ -779,62 +1004,63 @@ def send_results_recap_email(tournament_id: int) -> int:
 
         subject = f"📊 Results: {tournament_name}"
 
-        for user in users:
-            display_name = user.get_display_name()
-            user_email = user.email
-
-            pick = pick_by_user.get(user.id)
-            user_standing = standings.get(user.id, {'rank': total_users, 'total_points': 0})
-            rank = user_standing['rank']
-            is_tied = rank_counts.get(rank, 1) > 1
-            rank_str = f"T{rank}" if is_tied else str(rank)
-            rank_display = f"{rank_str} of {total_users}"
-            season_total = user_standing['total_points']
-
-            # User's pick details
-            if pick and pick.active_player_id:
-                active = pick.active_player
-                golfer_name = f"{active.first_name} {active.last_name}" if active else "N/A"
-                earnings = pick.points_earned or 0
-                backup_activated = (
-                    pick.active_player_id == pick.backup_player_id
+        with smtp_connection() as server:
+            for user in users:
+                display_name = user.get_display_name()
+                user_email = user.email
+
+                pick = pick_by_user.get(user.id)
+                user_standing = standings.get(user.id, {'rank': total_users, 'total_points': 0})
+                rank = user_standing['rank']
+                is_tied = rank_counts.get(rank, 1) > 1
+                rank_str = f"T{rank}" if is_tied else str(rank)
+                rank_display = f"{rank_str} of {total_users}"
+                season_total = user_standing['total_points']
+
+                # User's pick details
+                if pick and pick.active_player_id:
+                    active = pick.active_player
+                    golfer_name = f"{active.first_name} {active.last_name}" if active else "N/A"
+                    earnings = pick.points_earned or 0
+                    backup_activated = (
+                        pick.active_player_id == pick.backup_player_id
+                    )
+                    result = TournamentResult.query.filter_by(
+                        tournament_id=tournament_id,
+                        player_id=pick.active_player_id
+                    ).first()
+                    position = result.final_position if result else "—"
+                    score = format_score_to_par(result.score_to_par) if result else None
+                elif pick:
+                    # Pick exists but no active player resolved (both WD edge case)
+                    golfer_name = f"{pick.primary_player.first_name} {pick.primary_player.last_name}"
+                    earnings = pick.points_earned or 0
+                    backup_activated = False
+                    position = "WD"
+                    score = None
+                else:
+                    # No pick submitted
+                    golfer_name = None
+                    earnings = 0
+                    backup_activated = False
+                    position = None
+                    score = None
+
+                plain = _build_recap_plain_text(
+                    display_name, tournament_name, golfer_name, position,
+                    earnings, backup_activated, rank_display, season_total,
+                    top_3, user.id, season_year
+                )
+                html = _build_recap_html(
+                    display_name, tournament_name, golfer_name, position,
+                    score, earnings, backup_activated, rank_display, season_total,
+                    top_3, user.id, season_year
                 )
-                result = TournamentResult.query.filter_by(
-                    tournament_id=tournament_id,
-                    player_id=pick.active_player_id
-                ).first()
-                position = result.final_position if result else "—"
-                score = format_score_to_par(result.score_to_par) if result else None
-            elif pick:
-                # Pick exists but no active player resolved (both WD edge case)
-                golfer_name = f"{pick.primary_player.first_name} {pick.primary_player.last_name}"
-                earnings = pick.points_earned or 0
-                backup_activated = False
-                position = "WD"
-                score = None
-            else:
-                # No pick submitted
-                golfer_name = None
-                earnings = 0
-                backup_activated = False
-                position = None
-                score = None
-
-            plain = _build_recap_plain_text(
-                display_name, tournament_name, golfer_name, position,
-                earnings, backup_activated, rank_display, season_total,
-                top_3, user.id, season_year
-            )
-            html = _build_recap_html(
-                display_name, tournament_name, golfer_name, position,
-                score, earnings, backup_activated, rank_display, season_total,
-                top_3, user.id, season_year
-            )
 
-            if send_email(user_email, subject, plain, html_body=html):
-                success_count += 1
+                if send_email(user_email, subject, plain, html_body=html, server=server):
+                    success_count += 1
 
-        print(f"\n📊 Results Recap Summary: {success_count}/{len(users)} emails sent")
+        logger.info(f"\n📊 Results Recap Summary: {success_count}/{len(users)} emails sent")
         return success_count
 
 
@@ -1042,36 +1268,49 @@ def main():
     """Main reminder processing function."""
     now = get_current_time()
 
-    print()
-    print("=" * 60)
-    print(f"Golf Pick 'Em Reminder Check")
-    print(f"Time: {now.strftime('%A, %B %d, %Y at %I:%M %p %Z')}")
-    print("=" * 60)
+    logger.info("")
+    logger.info("=" * 60)
+    logger.info(f"Golf Pick 'Em Reminder Check")
+    logger.info(f"Time: {now.strftime('%A, %B %d, %Y at %I:%M %p %Z')}")
+    logger.info("=" * 60)
 
     if not CONFIG_LOADED:
-        print("\n❌ Cannot proceed without email configuration")
+        logger.error("\n❌ Cannot proceed without email configuration")
         return
 
+    _load_orm()
     with _app_context():
-        tournament, deadline = get_upcoming_tournament_for_reminders()
+        tournament, deadline = get_upcoming_tournament_for_reminders(now)
 
         if not tournament:
-            print("\n📭 No upcoming tournaments within reminder window (or field not ready)")
+            logger.info("\n📭 No upcoming tournaments within reminder window")
             return
 
-        print(f"\n🏌️ Tournament: {tournament.name}")
-        print(f"📅 Deadline: {deadline.strftime('%A, %B %d at %I:%M %p %Z')}")
-        print(f"⏱️ Time remaining: {format_time_remaining(deadline)}")
-        print(f"👥 Field size: {get_field_count(tournament.id)} players")
+        # Format the deadline once — the same string feeds the log line and
+        # every reminder email built below.
+        deadline_str = deadline.strftime('%A, %B %d at %I:%M %p %Z')
 
-        window = get_active_reminder_window(deadline)
+        logger.info(f"\n🏌️ Tournament: {tournament.name}")
+        logger.info(f"📅 Deadline: {deadline_str}")
+        logger.info(f"⏱️ Time remaining: {format_time_remaining(deadline, now)}")
+
+        # Cheap time-only window check gates everything below — the field
+        # COUNT and user/pick queries only run when a window is active.
+        window = get_active_reminder_window(deadline, now)
 
         if not window:
-            print(f"\n⏳ Not within any reminder window")
-            print(f"   Next windows: 24h, 12h, 1h before deadline")
+            logger.info(f"\n⏳ Not within any reminder window")
+            logger.info(f"   Next windows: 24h, 12h, 1h before deadline")
             return
 
-        print(f"\n📬 Active reminder window: {window['hours']}-hour ({window['type']})")
+        logger.info(f"\n📬 Active reminder window: {window['hours']}-hour ({window['type']})")
+
+        field_count = get_field_count(tournament.id)
+        logger.info(f"👥 Field size: {field_count} players")
+        if field_count < MIN_FIELD_SIZE:
+            logger.warning(f"⚠️ Field not ready for {tournament.name} ({field_count} players)")
+            logger.info(f"   Reminders will not be sent until field has ≥{MIN_FIELD_SIZE} players")
+            return
 
         # Dedup: skip if this tier (or a later tier) was already sent
         REMINDER_ORDER = {'24h': 0, '12h': 1, '1h': 2}
@@ -1081,16 +1320,16 @@ def main():
             last_order = REMINDER_ORDER.get(tournament.last_reminder_type, -1)
             current_order = REMINDER_ORDER.get(current_tier, -1)
             if current_order <= last_order:
-                print(f"\n✅ {current_tier} reminder already sent (last sent: {tournament.last_reminder_type}). Skipping.")
+                logger.info(f"\n✅ {current_tier} reminder already sent (last sent: {tournament.last_reminder_type}). Skipping.")
                 return
 
         users_without_picks = get_users_without_picks(tournament.id)
 
         if not users_without_picks:
-            print(f"\n✅ All users have made their picks for {tournament.name}!")
+            logger.info(f"\n✅ All users have made their picks for {tournament.name}!")
             return
 
-        print(f"\n👥 Users without picks: {len(users_without_picks)}")
+        logger.info(f"\n👥 Users without picks: {len(users_without_picks)}")
 
         # Extract tournament data (primitives, not ORM references)
         tournament_name = tournament.name
@@ -1098,7 +1337,9 @@ def main():
         tournament_purse = tournament.purse
         tournament_season_year = tournament.season_year
 
-        success_count = 0
+        # Build all messages first (primitives only), then fan the I/O-bound
+        # sends out across the worker pool.
+        messages = []
         for user in users_without_picks:
             user_email = user.email
             user_display_name = user.get_display_name()
@@ -1114,23 +1355,24 @@ def main():
                 tournament_purse=tournament_purse,
                 tournament_season_year=tournament_season_year,
                 deadline=deadline,
-                window=window
+                window=window,
+                deadline_str=deadline_str
             )
+            messages.append((user_email, subject, plain, html))
 
-            if send_email(user_email, subject, plain, html_body=html):
-                success_count += 1
+        success_count = send_emails_concurrent(messages)
 
         if success_count > 0:
             tournament.last_reminder_type = current_tier
             db.session.commit()
-            print(f"📝 Recorded {current_tier} reminder as sent")
+            logger.info(f"📝 Recorded {current_tier} reminder as sent")
         else:
-            print(f"⚠️ No emails sent successfully — not recording {current_tier} as sent")
+            logger.warning(f"⚠️ No emails sent successfully — not recording {current_tier} as sent")
 
-        print()
-        print("-" * 60)
-        print(f"📊 Summary: {success_count}/{len(users_without_picks)} reminders sent")
-        print("=" * 60)
+        logger.info("")
+        logger.info("-" * 60)
+        logger.info(f"📊 Summary: {success_count}/{len(users_without_picks)} reminders sent")
+        logger.info("=" * 60)
 
 
 if __name__ == "__main__":
@@ -20,37 +20,67 @@ Email Notifications:
 - Admin Alert - Sent on Wednesday evening if field still has <50 players
 """
 
+import json
 import logging
 import os
 import random
+import re
 import sys
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Iterator, Optional, Dict, List, Tuple
 
 import click
 import pytz
 import requests
+from sqlalchemy import func, or_, select, update
 
-from models import db, Tournament, Player, TournamentField, TournamentResult, Pick, LEAGUE_TZ, PURSE_ESTIMATES, DEFAULT_PURSE
+from models import db, Tournament, Player, TournamentField, TournamentResult, Pick, User, LEAGUE_TZ, PURSE_ESTIMATES, DEFAULT_PURSE
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Optional JSON accelerator — leaderboard payloads run tens of KB and decode
+# on the sync thread. orjson parses them several times faster; stdlib json is
+# the drop-in fallback when it isn't installed.
+try:
+    import orjson
+
+    def _json_loads(payload: bytes):
+        return orjson.loads(payload)
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 # Dedicated API call logger for auditing RapidAPI usage
 API_CALL_LOGGER = logging.getLogger("api_calls")
 API_CALL_LOGGER.setLevel(logging.INFO)
 if not API_CALL_LOGGER.handlers:
-    from logging.handlers import RotatingFileHandler
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
     log_dir = os.path.join(os.path.dirname(__file__), "logs")
     os.makedirs(log_dir, exist_ok=True)
-    handler = RotatingFileHandler(
+    _file_handler = RotatingFileHandler(
         os.path.join(log_dir, "api_calls.log"),
         maxBytes=500_000,  # ~500KB per file
         backupCount=3
     )
-    handler.setFormatter(logging.Formatter("%(asctime)s\t%(message)s"))
-    API_CALL_LOGGER.addHandler(handler)
+    _file_handler.setFormatter(logging.Formatter("%(asctime)s\t%(message)s"))
+    # Call sites only enqueue the record; a listener thread owns the disk
+    # writes, so the pooled fetch threads never serialize on the file lock.
+    _log_queue: "queue.Queue" = queue.Queue(-1)
+    API_CALL_LOGGER.addHandler(QueueHandler(_log_queue))
+    _API_LOG_LISTENER = QueueListener(_log_queue, _file_handler)
+    _API_LOG_LISTENER.start()
+    atexit.register(_API_LOG_LISTENER.stop)
 
 # Tournaments to EXCLUDE from the league
 # (opposite-field events, playoffs finale, special events)
@@ -63,12 +93,40 @@ EXCLUDED_TOURNAMENTS = {
     'Presidents Cup',
 }
 
+_EVENT_NAME_JUNK_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _normalize_event_name(name: str) -> str:
+    """Canonical form for matching API event names against our tables."""
+    return _EVENT_NAME_JUNK_RE.sub("", name.casefold())
+
+
+# Normalized views of the name-keyed tables, built once at import. API event
+# names drift in capitalization and punctuation (sponsor renames especially),
+# and an exact-string miss fails silently — an excluded event slips through
+# or a major falls back to DEFAULT_PURSE.
+_EXCLUDED_NORM = frozenset(_normalize_event_name(name) for name in EXCLUDED_TOURNAMENTS)
+_PURSE_ESTIMATES_NORM = {_normalize_event_name(name): purse for name, purse in PURSE_ESTIMATES.items()}
+
 # Ignore any API events starting on or after this date.
 SEASON_CUTOFF_DATE = datetime(2026, 8, 24, tzinfo=pytz.UTC)
 
 # Minimum field size for "picks open" notification
 MIN_FIELD_SIZE = 50
 
+def _league_aware(dt: datetime) -> datetime:
+    """Return ``dt`` localized to LEAGUE_TZ when it loads naive.
+
+    SQLite strips tzinfo, so Tournament dates always come back naive —
+    this is the one place the aware/naive branch lives for the sync path.
+    """
+    return dt if dt.tzinfo else LEAGUE_TZ.localize(dt)
+
+
+# Clock-style tee time strings ("7:21am"), compiled once — strptime rebuilds
+# its format machinery on every call and this runs per player per field sync.
+_TEE_TIME_RE = re.compile(r"^(\d{1,2}):(\d{2})(am|pm)$", re.IGNORECASE)
+
 # PGA Tour Standard Payout Percentages (positions 1-65)
 # Source: PGA Tour payout structure for full-field events
 PAYOUT_PERCENTAGES = {
@@ -87,6 +145,24 @@ PAYOUT_PERCENTAGES = {
    61: 0.0022,  62: 0.0022,  63: 0.0022,  64: 0.0022,  65: 0.0022,
 }
 
+# Cumulative payout shares for positions 1..80, built once at import.
+# _CUM_PAYOUT[p] sums the shares for positions 1..p, so a tie spanning
+# positions a..b pays _CUM_PAYOUT[b] - _CUM_PAYOUT[a-1] — one subtraction
+# instead of a dict lookup per tied position. Positions 66-80 use the same
+# taper the old inline loop applied (~0.213% shrinking 0.002% per rank).
+# Stored in integer hundred-thousandths (every share has ≤5 decimal places)
+# so the prefix sums stay exact — no float cancellation drift.
+_MAX_PAYING_POSITION = 80
+_PCT_SCALE = 100_000
+_CUM_PAYOUT = [0]
+for _pos in range(1, _MAX_PAYING_POSITION + 1):
+    if _pos <= 65:
+        _units = round(PAYOUT_PERCENTAGES.get(_pos, 0) * _PCT_SCALE)
+    else:
+        _units = max(0, 213 - (_pos - 66) * 2)
+    _CUM_PAYOUT.append(_CUM_PAYOUT[-1] + _units)
+del _pos, _units
+
 
 def parse_score_to_par(total_str) -> Optional[int]:
     """
@@ -166,7 +242,58 @@ def normalize_position(raw) -> str:
     return str(raw).strip()
 
 
-def calculate_projected_earnings(position_str: str, purse: int, all_positions: List[str], is_major: bool = False) -> int:
+@lru_cache(maxsize=512)
+def _parse_iso_utc(value: str) -> datetime:
+    """Memoized ISO-8601 parse, defaulting naive values to UTC.
+
+    Playing partners share tee slots, so a 150-row field carries only a
+    few dozen distinct timestamp strings — caching skips the re-parse.
+    """
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = pytz.UTC.localize(dt)
+    return dt
+
+
+@lru_cache(maxsize=32)
+def _resolve_timezone(name: str) -> pytz.BaseTzInfo:
+    """Memoized pytz lookup — repeated syncs reuse the resolved tz object
+    instead of re-walking pytz's name resolution (and its exception path
+    for the handful of zone names the API has drifted through)."""
+    return pytz.timezone(name)
+
+
+def build_position_histogram(all_positions: List[str]) -> Dict[str, int]:
+    """
+    Count how many players share each (uppercased) leaderboard position.
+
+    Built once per sync so calculate_projected_earnings gets its tie count
+    as a dict lookup instead of rescanning the whole position list per
+    player (which made a full leaderboard quadratic).
+    """
+    return Counter(p.upper() for p in all_positions if p)
+
+
+@lru_cache(maxsize=256)
+def _parse_paying_position(position_upper: str) -> Optional[int]:
+    """
+    Parse an uppercased position string to its numeric base position.
+
+    Returns None for non-paying markers (CUT/WD/DQ/-) and unparseable text.
+    Memoized — a leaderboard has ~50 unique position strings for 150
+    players, so repeated calls per sync hit the cache instead of re-running
+    the strip-the-T-and-int dance.
+    """
+    if not position_upper or position_upper in ('CUT', 'WD', 'DQ', '-'):
+        return None
+    try:
+        return int(position_upper[1:] if position_upper.startswith('T') else position_upper)
+    except ValueError:
+        # Can't parse position (e.g., "E", unexpected text)
+        return None
+
+
+def calculate_projected_earnings(position_str: str, purse: int, tie_count: int = 1, is_major: bool = False) -> int:
     """
     Calculate projected earnings for a player based on position.
 
@@ -176,52 +303,39 @@ def calculate_projected_earnings(position_str: str, purse: int, all_positions: L
     Args:
         position_str: Position from API (e.g., "1", "T2", "T10", "CUT")
         purse: Tournament purse in dollars
-        all_positions: List of all position strings from leaderboard
+        tie_count: Players sharing this position — look it up in the
+            histogram from build_position_histogram()
 
     Returns:
         Projected earnings in dollars (integer)
     """
-    # Handle non-paying positions
-    if not position_str or position_str.upper() in ('CUT', 'WD', 'DQ', '-', ''):
+    # Handle non-paying / unparseable positions (memoized per unique string)
+    if not position_str:
+        return 0
+    base_position = _parse_paying_position(position_str.upper())
+    if base_position is None:
         return 0
 
     # Handle missing purse
     if not purse or purse <= 0:
         return 0
 
-    # Parse position (remove 'T' prefix for ties)
-    position_upper = position_str.upper()
-    is_tied = position_upper.startswith('T')
-
-    try:
-        base_position = int(position_upper[1:] if is_tied else position_upper)
-    except ValueError:
-        # Can't parse position (e.g., "E", "-", etc.)
-        return 0
-
     # Position beyond paying range
-    if base_position > 80:  # Reasonable upper limit
+    if base_position > _MAX_PAYING_POSITION:
         return 0
 
-    # Count players tied at this position
-    tie_count = sum(1 for p in all_positions if p and p.upper() == position_upper)
-    if tie_count == 0:
-        tie_count = 1  # At minimum, this player
-
-    # Calculate combined payout for tied positions
-    # E.g., T2 with 3 players: combine payouts for positions 2, 3, 4
-    total_percentage = 0.0
-    for i in range(tie_count):
-        pos = base_position + i
-        if pos <= 65:
-            total_percentage += PAYOUT_PERCENTAGES.get(pos, 0)
-        elif pos <= 80:
-            # Beyond 65: starts at ~0.213% and decreases by 0.002% per rank
-            beyond_65_pct = max(0, 0.00213 - (pos - 66) * 0.00002)
-            total_percentage += beyond_65_pct
+    # At minimum, this player is at the position
+    if tie_count < 1:
+        tie_count = 1
+
+    # Combined payout for tied positions from the prefix-sum table.
+    # E.g., T2 with 3 players spans positions 2-4:
+    # _CUM_PAYOUT[4] - _CUM_PAYOUT[1].
+    end = min(base_position + tie_count - 1, _MAX_PAYING_POSITION)
+    total_percentage = (_CUM_PAYOUT[end] - _CUM_PAYOUT[base_position - 1]) / _PCT_SCALE
 
     # Split evenly among tied players
-    player_percentage = total_percentage / tie_count if tie_count > 0 else 0
+    player_percentage = total_percentage / tie_count
 
     earnings = int(purse * player_percentage)
     if is_major:
@@ -235,6 +349,11 @@ class SlashGolfAPI:
     # RapidAPI configuration
     BASE_URL = "https://live-golf-data.p.rapidapi.com"
 
+    # Circuit-breaker tuning: open after this many consecutive
+    # exhausted-retry failures, for this many seconds.
+    _BREAKER_THRESHOLD = 3
+    _BREAKER_COOLDOWN = 60.0
+
     def __init__(self, api_key: str, api_host: str = "live-golf-data.p.rapidapi.com", sync_mode: str = "standard"):
         """
         Initialize API client.
@@ -254,9 +373,95 @@ class SlashGolfAPI:
         self.sync_mode = (sync_mode or "standard").lower()
         self._call_counter = 0
 
+        # Short-TTL memo of idempotent GETs — a mode=all run asks for the
+        # same leaderboard from several sync phases within seconds. TTLs are
+        # short enough that live data stays live; schedules barely move.
+        self._cache: Dict[Tuple, Tuple[float, Dict]] = {}
+        self._cache_ttl = {"leaderboard": 60, "earnings": 300, "schedule": 3600, "tournament": 3600}
+        # Last ETag seen per cache key. Expired cache entries stay in _cache,
+        # so a 304 revalidation can hand the stale body back without
+        # re-parsing — turns a post-TTL refetch into a header exchange.
+        self._etags: Dict[Tuple, str] = {}
+
+        # Circuit breaker: after _BREAKER_THRESHOLD straight exhausted-retry
+        # failures, stop calling the provider for _BREAKER_COOLDOWN seconds.
+        # Without it a mode=all run during a RapidAPI outage walks every
+        # tournament through the full retry ladder.
+        self._breaker_failures = 0
+        self._breaker_open_until = 0.0
+
+        # Client-side token bucket — pacing below the plan's QPS beats
+        # tripping 429s and eating their long backoffs. Overridable per
+        # RapidAPI tier; the lock keeps the pooled fetch threads honest.
+        self._rl_rate = float(os.environ.get('SLASHGOLF_RATE_LIMIT_RPS', 5.0))
+        self._rl_tokens = self._rl_rate
+        self._rl_ts = time.monotonic()
+        self._rl_lock = threading.Lock()
+        # When RapidAPI reports the quota nearly spent, hold new requests
+        # until the advertised reset instead of walking into a 429.
+        self._rl_hold_until = 0.0
+
+        # One pooled session for the client's lifetime — keep-alive reuses
+        # the TCP+TLS connection across the sequential sync calls instead of
+        # paying a fresh handshake per request.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections."""
+        self._session.close()
+
+    def _note_rate_headers(self, response) -> None:
+        """Record RapidAPI quota headers so the limiter can preempt 429s."""
+        try:
+            remaining = int(response.headers.get("X-RateLimit-Requests-Remaining", ""))
+            reset_s = float(response.headers.get("X-RateLimit-Requests-Reset", 0))
+        except (TypeError, ValueError):
+            return
+        if remaining < 3 and reset_s > 0:
+            hold = time.monotonic() + min(reset_s, 60.0)
+            with self._rl_lock:
+                self._rl_hold_until = max(self._rl_hold_until, hold)
+            logger.warning(
+                "RapidAPI quota nearly spent (%s remaining) — holding requests for up to %.0fs",
+                remaining,
+                min(reset_s, 60.0),
+            )
+
+    def _acquire_token(self) -> None:
+        """Block until the token bucket allows another request."""
+        hold = self._rl_hold_until - time.monotonic()
+        if hold > 0:
+            time.sleep(hold)
+        with self._rl_lock:
+            now = time.monotonic()
+            self._rl_tokens = min(self._rl_rate, self._rl_tokens + (now - self._rl_ts) * self._rl_rate)
+            self._rl_ts = now
+            wait = 0.0
+            if self._rl_tokens < 1.0:
+                wait = (1.0 - self._rl_tokens) / self._rl_rate
+                self._rl_tokens = 1.0
+                self._rl_ts = now + wait
+            self._rl_tokens -= 1.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def invalidate_cache(self, endpoint: Optional[str] = None) -> None:
+        """Drop memoized responses (for one endpoint, or all of them)."""
+        if endpoint is None:
+            self._cache.clear()
+        else:
+            self._cache = {k: v for k, v in self._cache.items() if k[0] != endpoint}
+
     def _log_api_call(self, endpoint: str, params: Dict, status: int, duration: float, attempt: int) -> None:
         """Record API call details for auditing."""
         self._call_counter += 1
+        # Skip params serialization entirely when the audit log is filtered —
+        # logging's lazy %s would still repr the dict once a handler runs.
+        if not API_CALL_LOGGER.isEnabledFor(logging.INFO):
+            return
         API_CALL_LOGGER.info(
             "count=%s\tmode=%s\tendpoint=%s\tstatus=%s\tattempt=%s\tduration=%.2fs\tparams=%s",
             self._call_counter,
@@ -265,28 +470,64 @@ class SlashGolfAPI:
             status,
             attempt,
             duration,
-            params,
+            _json_dumps(params),
         )
 
     def _make_request(self, endpoint: str, params: Dict = None, retries: int = 5) -> Optional[Dict]:
-        """Make API request with exponential backoff, jitter, and structured logging."""
+        """Make API request with full-jitter exponential backoff and structured logging."""
         url = f"{self.BASE_URL}/{endpoint}"
 
         if params is None:
             params = {}
         params["orgId"] = self.org_id
 
-        backoff = 1.5
+        ttl = self._cache_ttl.get(endpoint)
+        cache_key = (endpoint, tuple(sorted(params.items()))) if ttl else None
+        if cache_key:
+            cached = self._cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+        if time.monotonic() < self._breaker_open_until:
+            logger.warning("Circuit breaker open — skipping %s params=%s", endpoint, params)
+            return None
+
+        # Revalidate with If-None-Match when we hold an expired body for this
+        # key — a 304 lets us reuse it without re-downloading or re-parsing.
+        req_headers = None
+        if cache_key and cache_key in self._etags and cache_key in self._cache:
+            req_headers = {"If-None-Match": self._etags[cache_key]}
+
+        backoff_base = 1.5
+        backoff_cap = 60.0
         for attempt in range(1, retries + 1):
+            self._acquire_token()
             start_time = time.time()
+            retry_after = 0.0
             try:
-                response = requests.get(url, headers=self.headers, params=params, timeout=15)
+                response = self._session.get(url, params=params, headers=req_headers, timeout=15)
 
                 duration = time.time() - start_time
                 self._log_api_call(endpoint, params, response.status_code, duration, attempt)
+                self._note_rate_headers(response)
 
                 if response.status_code == 200:
-                    return response.json()
+                    self._breaker_failures = 0
+                    payload = _json_loads(response.content)
+                    if cache_key:
+                        self._cache[cache_key] = (time.monotonic() + ttl, payload)
+                        etag = response.headers.get("ETag")
+                        if etag:
+                            self._etags[cache_key] = etag
+                    return payload
+
+                if response.status_code == 304 and cache_key and cache_key in self._cache:
+                    # Body unchanged since last fetch — refresh the TTL on the
+                    # retained payload instead of re-parsing.
+                    self._breaker_failures = 0
+                    payload = self._cache[cache_key][1]
+                    self._cache[cache_key] = (time.monotonic() + ttl, payload)
+                    return payload
 
                 is_retryable = response.status_code in (429, 500, 502, 503, 504)
                 logger.warning(
@@ -302,6 +543,11 @@ class SlashGolfAPI:
                 if not is_retryable:
                     break
 
+                try:
+                    retry_after = float(response.headers.get("Retry-After", 0))
+                except (TypeError, ValueError):
+                    retry_after = 0.0
+
             except requests.RequestException as exc:
                 logger.exception(
                     "Request failed for %s params=%s (attempt %s/%s)",
@@ -314,11 +560,22 @@ class SlashGolfAPI:
                 self._log_api_call(endpoint, params, 0, duration, attempt)
 
             if attempt < retries:
-                sleep_for = min(60, backoff * (2 ** (attempt - 1)))
-                sleep_for = sleep_for * (1 + random.uniform(-0.25, 0.25))
-                time.sleep(max(0.5, sleep_for))
+                # Full jitter (AWS-style): sleep anywhere in [0, window] so a
+                # burst of clients retrying a 429 doesn't resynchronize; a
+                # Retry-After header from the provider sets the floor.
+                window = min(backoff_cap, backoff_base * (2 ** (attempt - 1)))
+                sleep_for = random.uniform(0, window)
+                time.sleep(max(retry_after, sleep_for))
 
         logger.error("Exhausted retries for endpoint %s params=%s", endpoint, params)
+        self._breaker_failures += 1
+        if self._breaker_failures >= self._BREAKER_THRESHOLD:
+            self._breaker_open_until = time.monotonic() + self._BREAKER_COOLDOWN
+            logger.error(
+                "Circuit breaker opened for %.0fs after %s consecutive failures",
+                self._BREAKER_COOLDOWN,
+                self._breaker_failures,
+            )
         return None
 
     def get_schedule(self, year: str) -> Optional[Dict]:
@@ -345,17 +602,40 @@ class TournamentSync:
         self.api = api
         self.sync_mode = (sync_mode or "standard").lower()
         self.fallback_deadline_hour = fallback_deadline_hour
+        # Lazily built {api_player_id: Player.id} shared across sync methods
+        # within one CLI run; sync_tournament_field invalidates it after
+        # inserting new players.
+        self._player_id_cache: Optional[Dict[str, int]] = None
 
     @property
     def is_free_mode(self) -> bool:
         return self.sync_mode == "free"
 
+    def _get_player_map(self) -> Dict[str, int]:
+        """Return the cached {api_player_id: Player.id} map, loading it once.
+
+        A mode=all run touches the same Player rows from the results, live
+        and withdrawal syncs — one table-wide id scan beats re-running an
+        IN-query per method (the whole table is a few hundred tiny rows).
+        """
+        if self._player_id_cache is None:
+            self._player_id_cache = {
+                api_player_id: player_id
+                for api_player_id, player_id in db.session.execute(
+                    select(Player.api_player_id, Player.id)
+                )
+            }
+        return self._player_id_cache
+
+    def _invalidate_player_map(self) -> None:
+        self._player_id_cache = None
+
     @staticmethod
     def _get_event_timezone(leaderboard_data: Dict) -> pytz.timezone:
         tz_name = leaderboard_data.get("timeZone") or leaderboard_data.get("timezone") or leaderboard_data.get("tz")
         if tz_name:
             try:
-                return pytz.timezone(tz_name)
+                return _resolve_timezone(tz_name)
             except Exception:
                 logger.warning("Unknown timezone '%s', falling back to league TZ", tz_name)
         else:
@@ -375,37 +655,48 @@ class TournamentSync:
         if not tee_time_ts:
             return None
 
-        try:
-            # Handle MongoDB-style timestamp format
-            if isinstance(tee_time_ts, dict):
-                if '$date' in tee_time_ts:
-                    date_val = tee_time_ts['$date']
-                    if isinstance(date_val, dict) and '$numberLong' in date_val:
-                        ts_ms = int(date_val['$numberLong'])
-                    else:
-                        ts_ms = int(date_val)
-                elif '$numberLong' in tee_time_ts:
-                    ts_ms = int(tee_time_ts['$numberLong'])
-                else:
-                    return None
-                ts_sec = ts_ms / 1000
-                return datetime.fromtimestamp(ts_sec, tz=pytz.UTC)
+        # Timestamp-shaped payloads (MongoDB dict / raw integer)
+        ts_ms = TournamentSync._extract_tee_ts_ms(tee_time_ts)
+        if ts_ms is not None:
+            return datetime.fromtimestamp(ts_ms / 1000, tz=pytz.UTC)
 
+        try:
             # Handle ISO 8601 string (new API format)
             if isinstance(tee_time_ts, str) and "T" in tee_time_ts:
-                dt = datetime.fromisoformat(tee_time_ts.replace("Z", "+00:00"))
-                if dt.tzinfo is None:
-                    dt = pytz.UTC.localize(dt)
-                return dt
-
-            # Handle raw millisecond integer
-            ts_ms = int(tee_time_ts)
-            ts_sec = ts_ms / 1000
-            return datetime.fromtimestamp(ts_sec, tz=pytz.UTC)
+                return _parse_iso_utc(tee_time_ts)
+            raise ValueError("not a recognized timestamp shape")
         except Exception as e:
             logger.warning("Unable to parse tee time timestamp '%s': %s", tee_time_ts, e)
             return None
 
+    @staticmethod
+    def _extract_tee_ts_ms(tee_time_ts) -> Optional[int]:
+        """
+        Pull raw epoch-milliseconds out of a timestamp-shaped tee time
+        (MongoDB dict or raw integer) without building a datetime.
+
+        Returns None for ISO strings and anything unrecognized — callers
+        fall back to _parse_tee_time_timestamp for those. Finding the
+        earliest tee time only needs integer comparisons, so the field
+        loop defers datetime construction to a single call after the scan.
+        """
+        if not tee_time_ts or isinstance(tee_time_ts, str):
+            return None
+
+        try:
+            if isinstance(tee_time_ts, dict):
+                if '$date' in tee_time_ts:
+                    date_val = tee_time_ts['$date']
+                    if isinstance(date_val, dict) and '$numberLong' in date_val:
+                        return int(date_val['$numberLong'])
+                    return int(date_val)
+                if '$numberLong' in tee_time_ts:
+                    return int(tee_time_ts['$numberLong'])
+                return None
+            return int(tee_time_ts)
+        except (ValueError, TypeError):
+            return None
+
     @staticmethod
     def _parse_tee_time(tee_time_str: Optional[str], tournament_date: datetime, event_tz: pytz.timezone) -> Optional[datetime]:
         """
@@ -424,8 +715,20 @@ class TournamentSync:
                     dt = event_tz.localize(dt)
                 return dt
 
-            tee_time_parsed = datetime.strptime(tee_time_str, "%I:%M%p")
-            tee_datetime = datetime.combine(tournament_date.date(), tee_time_parsed.time())
+            match = _TEE_TIME_RE.match(tee_time_str)
+            if not match:
+                logger.warning("Unable to parse tee time '%s'", tee_time_str)
+                return None
+            hour = int(match.group(1))
+            minute = int(match.group(2))
+            if not (1 <= hour <= 12 and minute <= 59):
+                logger.warning("Unable to parse tee time '%s'", tee_time_str)
+                return None
+            hour %= 12
+            if match.group(3).lower() == "pm":
+                hour += 12
+            day = tournament_date.date()
+            tee_datetime = datetime(day.year, day.month, day.day, hour, minute)
             return event_tz.localize(tee_datetime)
         except Exception:
             logger.warning("Unable to parse tee time '%s'", tee_time_str)
@@ -462,31 +765,18 @@ class TournamentSync:
                 merged["isAmateur"] = member.get("isAmateur", False)
                 yield merged
 
-    def _update_pick_deadline_from_leaderboard(self, tournament: Tournament, leaderboard_data: Dict) -> Optional[datetime]:
-        event_tz = self._get_event_timezone(leaderboard_data)
-        earliest = None
-
-        for player_data in self._iter_player_rows(leaderboard_data.get("leaderboardRows", [])):
-            # Prefer timestamp (timezone-safe) over string (ambiguous)
-            tee_time = self._parse_tee_time_timestamp(player_data.get("teeTimeTimestamp"))
-            if not tee_time:
-                # Fallback to string parsing if timestamp not available
-                tee_time = (
-                    self._parse_tee_time(player_data.get("teeTime"), tournament.start_date, event_tz)
-                    or self._parse_tee_time(player_data.get("teeTimeLocal"), tournament.start_date, event_tz)
-                )
-            if tee_time and (earliest is None or tee_time < earliest):
-                earliest = tee_time
+    def _derive_status(self, tournament: Tournament, leaderboard_data: Optional[Dict] = None,
+                       now: Optional[datetime] = None) -> str:
+        """Derive tournament status from the API hint and the clock.
 
-        if earliest:
-            tournament.pick_deadline = earliest
-        return earliest
-
-    def _derive_status(self, tournament: Tournament, leaderboard_data: Optional[Dict] = None) -> str:
+        Pass ``now`` to reuse one clock read across a batch (same pattern
+        as _refresh_statuses).
+        """
         status_hint = (leaderboard_data or {}).get("status", "").lower()
-        now = datetime.now(LEAGUE_TZ)
-        start = tournament.start_date if tournament.start_date.tzinfo else LEAGUE_TZ.localize(tournament.start_date)
-        end = tournament.end_date if tournament.end_date.tzinfo else LEAGUE_TZ.localize(tournament.end_date)
+        if now is None:
+            now = datetime.now(LEAGUE_TZ)
+        start = _league_aware(tournament.start_date)
+        end = _league_aware(tournament.end_date)
 
         if "complete" in status_hint or "official" in status_hint:
             tournament.status = "complete"
@@ -505,9 +795,7 @@ class TournamentSync:
 
     def _apply_fixed_deadline(self, tournament: Tournament) -> datetime:
         """Set a deterministic pick deadline when tee times aren't available."""
-        start_localized = tournament.start_date
-        if start_localized.tzinfo is None:
-            start_localized = LEAGUE_TZ.localize(start_localized)
+        start_localized = _league_aware(tournament.start_date)
 
         fixed_deadline = start_localized.replace(
             hour=self.fallback_deadline_hour,
@@ -520,15 +808,27 @@ class TournamentSync:
 
     @staticmethod
     def _parse_api_number(value):
-        """Parse MongoDB-style number format from API."""
-        if isinstance(value, dict):
-            if '$numberInt' in value:
-                return int(value['$numberInt'])
-            if '$numberLong' in value:
-                return int(value['$numberLong'])
-            if '$numberDouble' in value:
-                return int(float(value['$numberDouble']))
-        return int(value) if value else 0
+        """Parse MongoDB-style number format from API.
+
+        Fast path first: most fields arrive as plain numbers or numeric
+        strings, so try int() directly and only inspect the EJSON dict
+        shapes when that raises. Unparseable values raise exactly as
+        before (callers like the purse backfill rely on catching them).
+        """
+        if not value:
+            return 0
+        try:
+            return int(value)
+        except TypeError:
+            # EJSON dict shapes ({"$numberInt": ...} and friends)
+            if isinstance(value, dict):
+                if '$numberInt' in value:
+                    return int(value['$numberInt'])
+                if '$numberLong' in value:
+                    return int(value['$numberLong'])
+                if '$numberDouble' in value:
+                    return int(float(value['$numberDouble']))
+            raise
 
     def sync_schedule(self, year: int, tournament_names: List[str] = None) -> int:
         """
@@ -554,6 +854,13 @@ class TournamentSync:
 
         updated = 0
 
+        # One query for the season's tournaments instead of one SELECT per
+        # API event. Keyed by str() — tournId types drift between payloads.
+        existing_by_tid = {
+            str(t.api_tourn_id): t
+            for t in Tournament.query.filter_by(season_year=year).all()
+        }
+
         for event in data["schedule"]:
             name = event.get("name", "")
 
@@ -562,7 +869,7 @@ class TournamentSync:
                 continue
 
             # Skip excluded tournaments (opposite-field, playoffs finale, special events)
-            if name in EXCLUDED_TOURNAMENTS:
+            if _normalize_event_name(name) in _EXCLUDED_NORM:
                 continue
 
             # Skip events that start on or after the season cutoff date.
@@ -573,10 +880,7 @@ class TournamentSync:
                 continue
 
             # Only update existing tournaments — never create new ones
-            existing = Tournament.query.filter_by(
-                api_tourn_id=event["tournId"],
-                season_year=year
-            ).first()
+            existing = existing_by_tid.get(str(event["tournId"]))
 
             if not existing:
                 # Tournament not in our league — skip it
@@ -595,7 +899,9 @@ class TournamentSync:
         return updated
 
 
-    def sync_tournament_field(self, tournament: Tournament, is_wednesday_evening: bool = False) -> Tuple[int, Optional[datetime]]:
+    def sync_tournament_field(self, tournament: Tournament, is_wednesday_evening: bool = False,
+                              alert_collector: Optional[List[Tuple[int, int]]] = None,
+                              leaderboard_data: Optional[Dict] = None) -> Tuple[int, Optional[datetime]]:
         """
         Sync tournament field and get first tee time.
         Call this Tuesday/Wednesday before the tournament.
@@ -603,12 +909,19 @@ class TournamentSync:
         Args:
             tournament: Tournament object to sync
             is_wednesday_evening: True if this is the Wednesday evening pass (for admin alerts)
+            alert_collector: When given, admin field alerts are appended as
+                (tournament_id, field_count) instead of being emailed here,
+                so a multi-tournament sync can send one combined alert.
+            leaderboard_data: Prefetched leaderboard payload (optional —
+                fetched here when omitted)
 
         Returns:
             Tuple of (new_players_synced, first_tee_time)
         """
         # Get leaderboard data (has field + tee times)
-        data = self.api.get_leaderboard(tournament.api_tourn_id, str(tournament.season_year))
+        data = leaderboard_data
+        if data is None:
+            data = self.api.get_leaderboard(tournament.api_tourn_id, str(tournament.season_year))
 
         if not data or "leaderboardRows" not in data:
             logger.error("Failed to fetch leaderboard for %s", tournament.name)
@@ -617,44 +930,77 @@ class TournamentSync:
         new_players_synced = 0
         existing_players = 0
         first_tee_time = None
+        earliest_ms = None  # earliest timestamp-shaped tee time, as raw epoch-ms
         event_tz = self._get_event_timezone(data)
 
         try:
-            for player_data in self._iter_player_rows(data["leaderboardRows"]):
-                if player_data.get("isAmateur", False):
-                    continue
-
-                player = Player.query.filter_by(
-                    api_player_id=player_data["playerId"]
-                ).first()
-
-                if not player:
+            # Prefetch known players and the existing field in two queries —
+            # per-player SELECTs turn a ~150-player field into ~300 round-trips.
+            # Only ids are needed here, so Core selects skip ORM hydration.
+            rows = [r for r in self._iter_player_rows(data["leaderboardRows"])
+                    if not r.get("isAmateur", False)]
+            api_ids = [r["playerId"] for r in rows]
+            player_ids_by_api_id = {
+                api_player_id: player_id
+                for player_id, api_player_id in db.session.execute(
+                    select(Player.id, Player.api_player_id)
+                    .where(Player.api_player_id.in_(api_ids))
+                )
+            } if api_ids else {}
+            field_player_ids = {
+                pid for (pid,) in db.session.execute(
+                    select(TournamentField.player_id)
+                    .where(TournamentField.tournament_id == tournament.id)
+                )
+            }
+
+            # Create any unknown players up front and flush once — a single
+            # batched INSERT assigns every id, instead of one flush per new
+            # player inside the loop.
+            new_players = []
+            for player_data in rows:
+                if player_data["playerId"] not in player_ids_by_api_id:
                     player = Player(
                         api_player_id=player_data["playerId"],
                         first_name=player_data.get("firstName", ""),
                         last_name=player_data.get("lastName", ""),
                         is_amateur=player_data.get("isAmateur", False)
                     )
-                    db.session.add(player)
-                    db.session.flush()
-
-                field_entry = TournamentField.query.filter_by(
-                    tournament_id=tournament.id,
-                    player_id=player.id
-                ).first()
-
-                if not field_entry:
+                    player_ids_by_api_id[player.api_player_id] = None
+                    new_players.append(player)
+            if new_players:
+                db.session.add_all(new_players)
+                db.session.flush()
+                for player in new_players:
+                    player_ids_by_api_id[player.api_player_id] = player.id
+                # The shared map (if built) no longer covers these players.
+                self._invalidate_player_map()
+
+            for player_data in rows:
+                player_id = player_ids_by_api_id[player_data["playerId"]]
+
+                if player_id not in field_player_ids:
                     field_entry = TournamentField(
                         tournament_id=tournament.id,
-                        player_id=player.id
+                        player_id=player_id
                     )
                     db.session.add(field_entry)
+                    field_player_ids.add(player_id)
                     new_players_synced += 1
                 else:
                     existing_players += 1
 
-                # Prefer timestamp (timezone-safe) over string (ambiguous)
-                tee_time = self._parse_tee_time_timestamp(player_data.get("teeTimeTimestamp"))
+                # Prefer timestamp (timezone-safe) over string (ambiguous).
+                # Timestamp-shaped values are compared as raw integers — one
+                # datetime gets built after the scan instead of one per player.
+                raw_ts = player_data.get("teeTimeTimestamp")
+                ts_ms = self._extract_tee_ts_ms(raw_ts)
+                if ts_ms is not None:
+                    if earliest_ms is None or ts_ms < earliest_ms:
+                        earliest_ms = ts_ms
+                    continue
+
+                tee_time = self._parse_tee_time_timestamp(raw_ts)
                 if not tee_time:
                     # Fallback to string parsing if timestamp not available
                     tee_time = (
@@ -664,6 +1010,11 @@ class TournamentSync:
                 if tee_time and (first_tee_time is None or tee_time < first_tee_time):
                     first_tee_time = tee_time
 
+            if earliest_ms is not None:
+                ts_tee_time = datetime.fromtimestamp(earliest_ms / 1000, tz=pytz.UTC)
+                if first_tee_time is None or ts_tee_time < first_tee_time:
+                    first_tee_time = ts_tee_time
+
             if first_tee_time:
                 # Convert to Central Time before storing (SQLite loses timezone info)
                 if first_tee_time.tzinfo:
@@ -691,8 +1042,13 @@ class TournamentSync:
                 )
             db.session.commit()
             
-            # Get total field count after commit
-            total_field_count = TournamentField.query.filter_by(tournament_id=tournament.id).count()
+            # Get total field count after commit (plain COUNT — no subquery,
+            # no row hydration)
+            total_field_count = db.session.scalar(
+                select(func.count())
+                .select_from(TournamentField)
+                .where(TournamentField.tournament_id == tournament.id)
+            )
             
             # Improved logging message
             if new_players_synced > 0:
@@ -712,38 +1068,28 @@ class TournamentSync:
         # Store tournament_id before any session issues
         # =================================================================
         tournament_id = tournament.id
-        field_count = TournamentField.query.filter_by(tournament_id=tournament_id).count()
+        field_count = db.session.scalar(
+            select(func.count())
+            .select_from(TournamentField)
+            .where(TournamentField.tournament_id == tournament_id)
+        )
         
-        # Check if field is sufficient and we haven't sent the "picks open" email yet
+        # Check if field is sufficient and we haven't sent the "picks open" email yet.
+        # The send happens off-thread so the sync returns without waiting on SMTP.
         if field_count >= MIN_FIELD_SIZE and not tournament.picks_open_notified:
-            try:
-                from send_reminders import send_picks_open_email
-                # Pass tournament_id instead of tournament object to avoid session issues
-                emails_sent = send_picks_open_email(tournament_id)
-                if emails_sent > 0:
-                    # Re-query tournament to update flag
-                    tournament = db.session.get(Tournament, tournament_id)
-                    tournament.picks_open_notified = True
-                    db.session.commit()
-                    logger.info("Sent 'picks open' email to %s users for %s", emails_sent, tournament.name)
-            except Exception as e:
-                logger.error("Failed to send 'picks open' email for tournament %s: %s", tournament_id, e)
+            _EMAIL_EXECUTOR.submit(_send_picks_open_background, tournament_id)
         
         # Check if it's Wednesday evening and field is still insufficient - send admin alert
         if is_wednesday_evening and field_count < MIN_FIELD_SIZE:
             # Re-query tournament to check flag
             tournament = db.session.get(Tournament, tournament_id)
             if not tournament.field_alert_sent:
-                try:
-                    from send_reminders import send_admin_field_alert
-                    # Pass tournament_id instead of tournament object
-                    if send_admin_field_alert(tournament_id, field_count):
-                        tournament.field_alert_sent = True
-                        db.session.commit()
-                        logger.warning("Sent admin alert for tournament %s - only %s players in field", 
-                                      tournament_id, field_count)
-                except Exception as e:
-                    logger.error("Failed to send admin alert for tournament %s: %s", tournament_id, e)
+                if alert_collector is not None:
+                    # Caller batches alerts into one combined email
+                    alert_collector.append((tournament_id, field_count))
+                else:
+                    # Single-tournament path: send off-thread like picks-open
+                    _EMAIL_EXECUTOR.submit(_send_field_alert_background, tournament_id, field_count)
 
         return new_players_synced, first_tee_time
 
@@ -778,7 +1124,9 @@ class TournamentSync:
         logger.warning("Purse backfill: tournId %s not found in schedule", tournament.api_tourn_id)
         return None
 
-    def sync_tournament_results(self, tournament: Tournament) -> int:
+    def sync_tournament_results(self, tournament: Tournament,
+                                leaderboard_data: Optional[Dict] = None,
+                                earnings_data: Optional[Dict] = None) -> int:
         """
         Sync tournament results and ACTUAL earnings after completion.
         Call this Monday after tournament ends.
@@ -788,12 +1136,16 @@ class TournamentSync:
 
         Args:
             tournament: Tournament object to sync
+            leaderboard_data: Prefetched leaderboard payload (optional —
+                fetched here when omitted). Used by sync_many_results.
+            earnings_data: Prefetched earnings payload (optional, same deal)
 
         Returns:
             Number of results synced (0 if not ready or failed)
         """
         # First check if tournament is actually complete via API
-        leaderboard_data = self.api.get_leaderboard(tournament.api_tourn_id, str(tournament.season_year))
+        if leaderboard_data is None:
+            leaderboard_data = self.api.get_leaderboard(tournament.api_tourn_id, str(tournament.season_year))
 
         if not leaderboard_data:
             logger.error("Failed to fetch leaderboard for %s", tournament.name)
@@ -809,7 +1161,8 @@ class TournamentSync:
             return 0
 
         # Now fetch actual earnings
-        earnings_data = self.api.get_earnings(tournament.api_tourn_id, str(tournament.season_year))
+        if earnings_data is None:
+            earnings_data = self.api.get_earnings(tournament.api_tourn_id, str(tournament.season_year))
 
         if not earnings_data or "leaderboard" not in earnings_data:
             logger.error("Failed to fetch earnings for %s", tournament.name)
@@ -824,50 +1177,71 @@ class TournamentSync:
             tournament.is_team_event = True
 
         # Build lookup from leaderboard for status/rounds/score info. Flatten team
-        # rows so each teammate resolves to the team's leaderboard entry.
+        # rows so each teammate resolves to the team's leaderboard entry. Each
+        # entry carries its rounds count so the update loop doesn't re-derive it.
         leaderboard_lookup = {}
         if "leaderboardRows" in leaderboard_data:
-            for p in self._iter_player_rows(leaderboard_data["leaderboardRows"]):
-                leaderboard_lookup[p["playerId"]] = p
+            leaderboard_lookup = {
+                p["playerId"]: (p, len(p.get("rounds", [])))
+                for p in self._iter_player_rows(leaderboard_data["leaderboardRows"])
+            }
 
         results_synced = 0
 
         try:
-            for player_data in self._iter_player_rows(earnings_data["leaderboard"]):
+            # Prefetch known players and existing results in two queries
+            # instead of two SELECTs per earnings row.
+            earnings_rows = list(self._iter_player_rows(earnings_data["leaderboard"]))
+            player_ids_by_api_id = self._get_player_map()
+            result_ids_by_player_id = {
+                player_id: result_id
+                for result_id, player_id in db.session.execute(
+                    select(TournamentResult.id, TournamentResult.player_id)
+                    .where(TournamentResult.tournament_id == tournament.id)
+                )
+            }
+
+            # Collect existing-row changes as mappings and flush them in a
+            # single executemany UPDATE instead of letting the unit-of-work
+            # emit one UPDATE per result row at commit.
+            update_mappings = []
+            new_results = []
+            for player_data in earnings_rows:
                 player_id = player_data["playerId"]
 
-                player = Player.query.filter_by(api_player_id=player_id).first()
-                if not player:
+                db_player_id = player_ids_by_api_id.get(player_id)
+                if not db_player_id:
                     continue
 
-                lb_info = leaderboard_lookup.get(player_id, {})
-                rounds_completed = len(lb_info.get("rounds", []))
-                status = lb_info.get("status", "complete")
+                lb_info, rounds_completed = leaderboard_lookup.get(player_id, ({}, 0))
 
-                result = TournamentResult.query.filter_by(
-                    tournament_id=tournament.id,
-                    player_id=player.id
-                ).first()
+                # Parse actual earnings from API; score to par comes from the
+                # leaderboard "total" field.
+                fields = {
+                    "earnings": self._parse_api_number(player_data.get("earnings", 0)),
+                    "status": lb_info.get("status", "complete"),
+                    "rounds_completed": rounds_completed,
+                    "final_position": normalize_position(lb_info.get("position")),
+                    "score_to_par": parse_score_to_par(lb_info.get("total")),
+                }
 
-                if not result:
-                    result = TournamentResult(
+                result_id = result_ids_by_player_id.get(db_player_id)
+                if result_id:
+                    update_mappings.append({"id": result_id, **fields})
+                else:
+                    new_results.append(TournamentResult(
                         tournament_id=tournament.id,
-                        player_id=player.id
-                    )
-                    db.session.add(result)
-
-                # Parse actual earnings from API
-                result.earnings = self._parse_api_number(player_data.get("earnings", 0))
-
-                result.status = status
-                result.rounds_completed = rounds_completed
-                result.final_position = normalize_position(lb_info.get("position"))
-
-                # Parse score to par from leaderboard "total" field
-                result.score_to_par = parse_score_to_par(lb_info.get("total"))
+                        player_id=db_player_id,
+                        **fields
+                    ))
 
                 results_synced += 1
 
+            if update_mappings:
+                db.session.execute(update(TournamentResult), update_mappings)
+            if new_results:
+                db.session.add_all(new_results)
+
             # Capture the official purse if it was never set (e.g. a major whose
             # purse was announced after the last schedule sync) so the finalized
             # tournament shows the real purse instead of the season estimate.
@@ -885,6 +1259,54 @@ class TournamentSync:
             return 0
         return results_synced
 
+    def sync_many_results(self, tournaments: List[Tournament]) -> Dict[int, int]:
+        """
+        Finalize results for several tournaments, overlapping the API fetches.
+
+        The leaderboard and earnings calls are independent per tournament and
+        purely I/O-bound, so they run on a small thread pool; the DB writes
+        then happen serially on the calling thread (the SQLAlchemy session is
+        not thread-safe). Earnings are only fetched for tournaments whose
+        leaderboard reports Complete/Official, preserving the API call budget.
+
+        Returns:
+            Mapping of tournament.id -> number of results synced.
+        """
+        if not tournaments:
+            return {}
+
+        max_workers = min(4, len(tournaments))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            leaderboards = list(executor.map(
+                lambda t: self.api.get_leaderboard(t.api_tourn_id, str(t.season_year)),
+                tournaments,
+            ))
+            ready = [
+                (tournament, lb) for tournament, lb in zip(tournaments, leaderboards)
+                if lb and lb.get("status", "").lower() in ("complete", "official")
+            ]
+            earnings_by_id = {}
+            if ready:
+                earnings_list = list(executor.map(
+                    lambda pair: self.api.get_earnings(pair[0].api_tourn_id, str(pair[0].season_year)),
+                    ready,
+                ))
+                earnings_by_id = {t.id: e for (t, _lb), e in zip(ready, earnings_list)}
+
+        counts: Dict[int, int] = {}
+        for tournament, leaderboard_data in zip(tournaments, leaderboards):
+            if leaderboard_data is None:
+                # The pooled fetch already retried — don't burn another call.
+                logger.error("Failed to fetch leaderboard for %s", tournament.name)
+                counts[tournament.id] = 0
+                continue
+            counts[tournament.id] = self.sync_tournament_results(
+                tournament,
+                leaderboard_data=leaderboard_data,
+                earnings_data=earnings_by_id.get(tournament.id),
+            )
+        return counts
+
     def process_tournament_picks(self, tournament: Tournament) -> int:
         """
         Process all picks for a completed tournament.
@@ -896,6 +1318,38 @@ class TournamentSync:
         Returns:
             Number of picks processed
         """
+        processed = self._process_picks(tournament)
+        db.session.commit()
+        return processed
+
+    def process_many_picks(self, tournaments: List[Tournament]) -> Dict[int, int]:
+        """
+        Resolve picks for several tournaments in one transaction.
+
+        Each tournament runs inside a SAVEPOINT so a failure rolls back
+        that tournament alone (same begin_nested pattern as
+        process_tournament_results in app.py); one commit at the end
+        replaces a commit per tournament.
+
+        Returns:
+            Mapping of tournament.id -> number of picks processed.
+        """
+        counts: Dict[int, int] = {}
+        for tournament in tournaments:
+            try:
+                with db.session.begin_nested():
+                    counts[tournament.id] = self._process_picks(tournament)
+            except Exception:  # noqa: BLE001 - isolate per-tournament failures
+                logger.exception(
+                    "Pick processing failed for %s; rolled back to savepoint",
+                    tournament.name,
+                )
+                counts[tournament.id] = 0
+        db.session.commit()
+        return counts
+
+    def _process_picks(self, tournament: Tournament) -> int:
+        """Resolve picks and recompute totals without committing."""
         if tournament.status != "complete":
             logger.warning("Tournament %s is not complete", tournament.name)
             return 0
@@ -903,6 +1357,7 @@ class TournamentSync:
         picks = Pick.query.filter_by(tournament_id=tournament.id).all()
         processed = 0
         skipped = 0
+        touched_user_ids = set()
 
         for pick in picks:
             try:
@@ -911,7 +1366,7 @@ class TournamentSync:
                     skipped += 1
                     continue
 
-                pick.user.calculate_total_points()
+                touched_user_ids.add(pick.user_id)
                 processed += 1
             except Exception as exc:  # noqa: BLE001 - continue to next pick
                 logger.warning(
@@ -921,7 +1376,10 @@ class TournamentSync:
                     exc,
                 )
 
-        db.session.commit()
+        # Recompute totals after all picks for this tournament have
+        # resolved — one grouped aggregate covers every touched user.
+        if touched_user_ids:
+            User.recalculate_total_points(touched_user_ids)
 
         logger.info(
             "Processed %s picks for %s (skipped %s)",
@@ -932,7 +1390,9 @@ class TournamentSync:
 
         return processed
 
-    def check_withdrawals(self, tournament: Tournament, force: bool = False) -> List[Dict]:
+    def check_withdrawals(self, tournament: Tournament, force: bool = False,
+                          leaderboard_data: Optional[Dict] = None,
+                          critical_collector: Optional[List[Dict]] = None) -> List[Dict]:
         """
         Check for withdrawals during a tournament.
         Useful for monitoring mid-tournament.
@@ -940,6 +1400,14 @@ class TournamentSync:
         Args:
             tournament: Active tournament to check
             force: If True, bypass free tier restriction (used by live-with-wd)
+            leaderboard_data: Prefetched leaderboard payload (optional —
+                fetched here when omitted). live-with-wd passes the payload
+                sync_live_leaderboard already fetched to avoid a second
+                identical API call seconds later.
+            critical_collector: When given, before-R2 withdrawals (the ones
+                that can trigger backup activation) are also appended here
+                during the scan, so callers don't re-filter the full list.
+                Same collector convention as sync_tournament_field.
 
         Returns:
             List of withdrawal info dicts
@@ -948,7 +1416,9 @@ class TournamentSync:
             logger.info("Free tier: skipping withdrawal check for %s", tournament.name)
             return []
 
-        data = self.api.get_leaderboard(tournament.api_tourn_id, str(tournament.season_year))
+        data = leaderboard_data
+        if data is None:
+            data = self.api.get_leaderboard(tournament.api_tourn_id, str(tournament.season_year))
 
         if not data or "leaderboardRows" not in data:
             return []
@@ -956,41 +1426,62 @@ class TournamentSync:
         withdrawals = []
 
         try:
-            for player_data in self._iter_player_rows(data["leaderboardRows"]):
-                if player_data.get("status") != "wd":
-                    continue
-
+            wd_rows = [r for r in self._iter_player_rows(data["leaderboardRows"])
+                       if r.get("status") == "wd"]
+            player_ids_by_api_id = self._get_player_map() if wd_rows else {}
+            results_by_player_id = {
+                r.player_id: r
+                for r in TournamentResult.query.filter_by(tournament_id=tournament.id).all()
+            } if wd_rows else {}
+
+            new_results = []
+            for player_data in wd_rows:
                 rounds = player_data.get("rounds", [])
                 rounds_completed = len(rounds)
 
-                player = Player.query.filter_by(api_player_id=player_data["playerId"]).first()
-                if not player:
+                player_id = player_ids_by_api_id.get(player_data["playerId"])
+                if not player_id:
                     continue
 
-                result = TournamentResult.query.filter_by(
-                    tournament_id=tournament.id,
-                    player_id=player.id
-                ).first()
-
+                result = results_by_player_id.get(player_id)
                 if not result:
                     result = TournamentResult(
                         tournament_id=tournament.id,
-                        player_id=player.id
+                        player_id=player_id
                     )
-                    db.session.add(result)
-
-                result.status = "wd"
-                result.rounds_completed = rounds_completed
-                result.final_position = normalize_position(player_data.get("position"))
-                result.score_to_par = parse_score_to_par(player_data.get("total"))
+                    new_results.append(result)
+                    results_by_player_id[player_id] = result
+
+                final_position = normalize_position(player_data.get("position"))
+                score_to_par = parse_score_to_par(player_data.get("total"))
+
+                # Known withdrawal with nothing new — don't dirty the row;
+                # the repeated Friday-evening checks would otherwise emit a
+                # no-op UPDATE per WD every run.
+                changed = not (
+                    result.status == "wd"
+                    and result.rounds_completed == rounds_completed
+                    and result.final_position == final_position
+                    and result.score_to_par == score_to_par
+                )
+                if changed:
+                    result.status = "wd"
+                    result.rounds_completed = rounds_completed
+                    result.final_position = final_position
+                    result.score_to_par = score_to_par
 
-                withdrawals.append({
+                withdrawal = {
                     "player_id": player_data["playerId"],
                     "name": f"{player_data.get('firstName', '')} {player_data.get('lastName', '')}",
                     "rounds_completed": rounds_completed,
                     "wd_before_r2": rounds_completed < 2
-                })
+                }
+                withdrawals.append(withdrawal)
+                if critical_collector is not None and withdrawal["wd_before_r2"]:
+                    critical_collector.append(withdrawal)
 
+            if new_results:
+                db.session.bulk_save_objects(new_results)
             db.session.commit()
         except Exception:
             db.session.rollback()
@@ -998,7 +1489,8 @@ class TournamentSync:
 
         return withdrawals
 
-    def sync_live_leaderboard(self, tournament: Tournament) -> int:
+    def sync_live_leaderboard(self, tournament: Tournament,
+                              leaderboard_data: Optional[Dict] = None) -> int:
         """
         Update live leaderboard data and PROJECTED earnings for an active tournament.
         Call this Thu-Sun at 8 PM CT after each round.
@@ -1008,11 +1500,15 @@ class TournamentSync:
 
         Args:
             tournament: Active tournament to sync
+            leaderboard_data: Prefetched leaderboard payload (optional —
+                fetched here when omitted)
 
         Returns:
             Number of players updated
         """
-        data = self.api.get_leaderboard(tournament.api_tourn_id, str(tournament.season_year))
+        data = leaderboard_data
+        if data is None:
+            data = self.api.get_leaderboard(tournament.api_tourn_id, str(tournament.season_year))
         if not data or "leaderboardRows" not in data:
             logger.error("Failed to fetch leaderboard for %s", tournament.name)
             return 0
@@ -1024,60 +1520,99 @@ class TournamentSync:
         if not tournament.is_team_event and any(r.get("players") for r in leaderboard_rows):
             tournament.is_team_event = True
 
-        # Collect positions for tie calculation from RAW rows — on team events each
-        # team is one payout slot, so we must not double-count teammates here.
-        all_positions = [p.get("position", "") for p in leaderboard_rows]
+        # Count ties once from RAW rows — on team events each team is one
+        # payout slot, so we must not double-count teammates here.
+        position_histogram = build_position_histogram(
+            [p.get("position", "") for p in leaderboard_rows]
+        )
 
         # Use API purse if available; fall back to estimate only when purse is $0
         purse = tournament.purse
         if not purse or purse <= 0:
-            purse = PURSE_ESTIMATES.get(tournament.name) or DEFAULT_PURSE
+            purse = _PURSE_ESTIMATES_NORM.get(_normalize_event_name(tournament.name)) or DEFAULT_PURSE
             logger.info("Using purse estimate $%s for %s (API purse not yet available)", f"{purse:,}", tournament.name)
 
         try:
             self._derive_status(tournament, data)
 
-            for player_data in self._iter_player_rows(leaderboard_rows):
-                player = Player.query.filter_by(api_player_id=player_data.get("playerId")).first()
-                if not player:
+            # Bulk-load players and existing results up front — the per-row
+            # lookups were two SELECTs per player (~300 round-trips a sync).
+            flat_rows = list(self._iter_player_rows(leaderboard_rows))
+            player_ids_by_api_id = self._get_player_map()
+            results_by_player_id = {
+                r.player_id: r
+                for r in TournamentResult.query.filter_by(tournament_id=tournament.id).all()
+            }
+
+            # Projected earnings depend only on (position, tie count) for a
+            # given purse — compute each distinct position once up front and
+            # dict-lookup per row instead of recomputing for every player.
+            earnings_by_position = {
+                pos: calculate_projected_earnings(
+                    position_str=pos,
+                    purse=purse,
+                    tie_count=tie_count,
+                    is_major=tournament.is_major,
+                )
+                for pos, tie_count in position_histogram.items()
+            }
+
+            # Fresh rows go through one batched bulk_save_objects; changes
+            # to existing rows are collected as mappings and flushed with a
+            # single executemany UPDATE instead of a per-row UPDATE from the
+            # unit-of-work.
+            new_results = []
+            update_mappings = []
+            for player_data in flat_rows:
+                player_id = player_ids_by_api_id.get(player_data.get("playerId"))
+                if not player_id:
                     continue
 
-                result = TournamentResult.query.filter_by(
-                    tournament_id=tournament.id,
-                    player_id=player.id
-                ).first()
+                existing = results_by_player_id.get(player_id)
 
-                if not result:
+                position = player_data.get("position", "")
+                fields = {
+                    "status": player_data.get(
+                        "status", (existing.status if existing else None) or "active"
+                    ),
+                    "rounds_completed": len(player_data.get("rounds", [])),
+                    # Keep the last-known position if this row omits one;
+                    # never store None.
+                    "final_position": (
+                        normalize_position(player_data.get("position"))
+                        or (existing.final_position if existing else "")
+                        or ""
+                    ),
+                    # Parse score to par from "total" field
+                    "score_to_par": parse_score_to_par(player_data.get("total")),
+                    # Projected earnings based on current position
+                    "earnings": earnings_by_position.get(
+                        position.upper() if position else "", 0
+                    ),
+                }
+
+                if existing is None:
                     result = TournamentResult(
                         tournament_id=tournament.id,
-                        player_id=player.id
+                        player_id=player_id,
+                        **fields
                     )
-                    db.session.add(result)
-
-                result.status = player_data.get("status", result.status or "active")
-                result.rounds_completed = len(player_data.get("rounds", []))
-                # Keep the last-known position if this row omits one; never store None.
-                result.final_position = (
-                    normalize_position(player_data.get("position"))
-                    or result.final_position
-                    or ""
-                )
-
-                # Parse score to par from "total" field
-                result.score_to_par = parse_score_to_par(player_data.get("total"))
-
-                # Calculate projected earnings based on current position
-                position = player_data.get("position", "")
-                projected_earnings = calculate_projected_earnings(
-                    position_str=position,
-                    purse=purse,
-                    all_positions=all_positions,
-                    is_major=tournament.is_major
-                )
-                result.earnings = projected_earnings
+                    new_results.append(result)
+                    results_by_player_id[player_id] = result
+                elif existing.id is None:
+                    # Duplicate leaderboard row for a just-created result —
+                    # refresh the pending object; bulk_save captures it.
+                    for attr, value in fields.items():
+                        setattr(existing, attr, value)
+                else:
+                    update_mappings.append({"id": existing.id, **fields})
 
                 updated += 1
 
+            if new_results:
+                db.session.bulk_save_objects(new_results)
+            if update_mappings:
+                db.session.execute(update(TournamentResult), update_mappings)
             db.session.commit()
 
             if tournament.is_major:
@@ -1098,6 +1633,93 @@ class TournamentSync:
 
         return updated
 
+    def fetch_leaderboards(self, tournaments: List[Tournament]) -> Dict[int, Optional[Dict]]:
+        """
+        Fetch leaderboards for several tournaments, overlapping the API calls.
+
+        Same shape as sync_many_results: the HTTPS round-trips fan out on a
+        small thread pool while all DB work stays on the calling thread.
+
+        Returns:
+            Mapping of tournament.id -> leaderboard payload (or None).
+        """
+        if not tournaments:
+            return {}
+
+        max_workers = min(4, len(tournaments))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            leaderboards = list(executor.map(
+                lambda t: self.api.get_leaderboard(t.api_tourn_id, str(t.season_year)),
+                tournaments,
+            ))
+        return {t.id: lb for t, lb in zip(tournaments, leaderboards)}
+
+    def sync_many_live(self, tournaments: List[Tournament]) -> Dict[int, int]:
+        """
+        Run the live-leaderboard sync for several tournaments, overlapping
+        the API fetches and writing serially.
+
+        Returns:
+            Mapping of tournament.id -> number of players updated.
+        """
+        leaderboards = self.fetch_leaderboards(tournaments)
+        counts: Dict[int, int] = {}
+        for tournament in tournaments:
+            leaderboard_data = leaderboards.get(tournament.id)
+            if not leaderboard_data:
+                # The pooled fetch already retried — don't burn another call.
+                logger.error("Failed to fetch leaderboard for %s", tournament.name)
+                counts[tournament.id] = 0
+                continue
+            counts[tournament.id] = self.sync_live_leaderboard(
+                tournament, leaderboard_data=leaderboard_data
+            )
+        return counts
+
+
+# Background pool for notification emails — field syncs run in cron windows
+# near tee time and shouldn't block on SMTP round-trips. submit() returns
+# immediately; the executor's non-daemon workers finish any in-flight send
+# before the process exits, so CLI runs still deliver.
+_EMAIL_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="email")
+
+
+def _send_picks_open_background(tournament_id: int) -> None:
+    """Email worker: send the picks-open blast, then persist the flag.
+
+    Runs on _EMAIL_EXECUTOR with its own app context and session — the
+    sync thread's session must not cross threads. The flag is only set
+    after a successful send, same as the old inline path.
+    """
+    try:
+        from app import app
+        from send_reminders import send_picks_open_email
+        emails_sent = send_picks_open_email(tournament_id)
+        if emails_sent > 0:
+            with app.app_context():
+                tournament = db.session.get(Tournament, tournament_id)
+                tournament.picks_open_notified = True
+                db.session.commit()
+                logger.info("Sent 'picks open' email to %s users for %s", emails_sent, tournament.name)
+    except Exception as e:
+        logger.error("Failed to send 'picks open' email for tournament %s: %s", tournament_id, e)
+
+
+def _send_field_alert_background(tournament_id: int, field_count: int) -> None:
+    """Email worker: send the Wednesday short-field admin alert, then flag it."""
+    try:
+        from app import app
+        from send_reminders import send_admin_field_alert
+        if send_admin_field_alert(tournament_id, field_count):
+            with app.app_context():
+                tournament = db.session.get(Tournament, tournament_id)
+                tournament.field_alert_sent = True
+                db.session.commit()
+                logger.warning("Sent admin alert for tournament %s - only %s players in field",
+                              tournament_id, field_count)
+    except Exception as e:
+        logger.error("Failed to send admin alert for tournament %s: %s", tournament_id, e)
+
 
 def get_upcoming_tournament(days_ahead: int = 7) -> Optional[Tournament]:
     """Get the next upcoming tournament within specified days."""
@@ -1123,27 +1745,57 @@ def get_just_completed_tournament() -> Optional[Tournament]:
     ).first()
 
 
-def _refresh_statuses(tournaments):
-    now = datetime.now(LEAGUE_TZ)
-    changed = False
-    for tournament in tournaments:
-        previous = tournament.status
-        tournament.update_status_from_time(now)
-        if tournament.status != previous:
-            changed = True
+def _refresh_statuses(tournaments, now: Optional[datetime] = None):
+    """Normalize time-derived statuses with two targeted bulk UPDATEs.
+
+    Mirrors update_status_from_time(): non-complete tournaments go active
+    once the deadline (or start date) or end date has passed, otherwise
+    upcoming — 'complete' is never set here. Doing it database-side avoids
+    a per-tournament dirty-track/UPDATE cycle on Monday rollovers. Dates
+    are stored as naive CT, so the comparison clock is naive CT too.
+
+    Pass ``now`` to share one clock read across the helpers in a CLI run.
+    """
+    if not tournaments:
+        return
+    if now is None:
+        now = datetime.now(LEAGUE_TZ)
+    if now.tzinfo:
+        now = now.astimezone(LEAGUE_TZ).replace(tzinfo=None)
+    ids = [t.id for t in tournaments]
+    time_says_active = or_(
+        func.coalesce(Tournament.pick_deadline, Tournament.start_date) <= now,
+        Tournament.end_date <= now,
+    )
+    changed = db.session.execute(
+        update(Tournament)
+        .where(Tournament.id.in_(ids), Tournament.status == "upcoming", time_says_active)
+        .values(status="active")
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    changed += db.session.execute(
+        update(Tournament)
+        .where(Tournament.id.in_(ids), Tournament.status == "active", ~time_says_active)
+        .values(status="upcoming")
+        .execution_options(synchronize_session=False)
+    ).rowcount
     if changed:
+        # Commit expires the already-loaded objects, so callers re-read
+        # the refreshed statuses on next attribute access.
         db.session.commit()
 
 
-def get_upcoming_tournaments_window(days_ahead: int = 10) -> List[Tournament]:
-    now = datetime.now(LEAGUE_TZ)
+def get_upcoming_tournaments_window(days_ahead: int = 10,
+                                    now: Optional[datetime] = None) -> List[Tournament]:
+    if now is None:
+        now = datetime.now(LEAGUE_TZ)
     cutoff = now + timedelta(days=days_ahead)
     tournaments = Tournament.query.filter(
         Tournament.start_date <= cutoff,
         Tournament.end_date >= now,
         Tournament.status != "complete",
     ).order_by(Tournament.start_date).all()
-    _refresh_statuses(tournaments)
+    _refresh_statuses(tournaments, now=now)
     return tournaments
 
 
@@ -1159,14 +1811,16 @@ def get_active_tournaments() -> List[Tournament]:
     ).order_by(Tournament.start_date).all()
 
 
-def get_recently_completed_tournaments(days_back: int = 2) -> List[Tournament]:
-    now = datetime.now(LEAGUE_TZ)
+def get_recently_completed_tournaments(days_back: int = 2,
+                                       now: Optional[datetime] = None) -> List[Tournament]:
+    if now is None:
+        now = datetime.now(LEAGUE_TZ)
     since = now - timedelta(days=days_back)
     tournaments = Tournament.query.filter(
         Tournament.end_date >= since,
         Tournament.end_date <= now + timedelta(hours=12),
     ).order_by(Tournament.end_date.desc()).all()
-    _refresh_statuses(tournaments)
+    _refresh_statuses(tournaments, now=now)
     return tournaments
 
 
@@ -1350,8 +2004,6 @@ def register_sync_commands(app):
             click.echo("Error: SLASHGOLF_API_KEY not set")
             sys.exit(1)
 
-        api = SlashGolfAPI(api_key, sync_mode=sync_mode)
-        sync = TournamentSync(api, sync_mode=sync_mode, fallback_deadline_hour=fallback_deadline_hour)
         exit_code = 0
         year = app.config.get('SEASON_YEAR', datetime.now().year)
 
@@ -1366,10 +2018,19 @@ def register_sync_commands(app):
         is_evening = now.hour >= 17  # 5 PM CT or later
         is_wednesday_evening = is_wednesday and is_evening
 
+        # A schedule-only run on a non-Monday does no work at all — skip
+        # before building the API client and its pooled session.
+        if mode == 'schedule' and now.weekday() != 0:  # 0 = Monday
+            click.echo("Schedule sync runs Mondays only (skipping today)")
+            return
+
+        api = SlashGolfAPI(api_key, sync_mode=sync_mode)
+        sync = TournamentSync(api, sync_mode=sync_mode, fallback_deadline_hour=fallback_deadline_hour)
+
         try:
             if mode in ('schedule', 'all'):
                 # Only sync schedule on Mondays to conserve API calls
-                if datetime.now(LEAGUE_TZ).weekday() != 0:  # 0 = Monday
+                if now.weekday() != 0:  # 0 = Monday
                     click.echo("Schedule sync runs Mondays only (skipping today)")
                 else:
                     imported = sync.sync_schedule(year)
@@ -1377,27 +2038,49 @@ def register_sync_commands(app):
 
             if mode in ('field', 'all'):
                 # Allow field syncs on Tuesday (1) and Wednesday (2)
-                weekday = datetime.now(LEAGUE_TZ).weekday()
+                weekday = now.weekday()
                 if sync_mode == 'free' and weekday not in (1, 2):
                     click.echo("Free tier: field sync limited to Tue/Wed to control API usage")
                 else:
-                    upcoming = get_upcoming_tournaments_window()
+                    upcoming = get_upcoming_tournaments_window(now=now)
                     if not upcoming:
                         click.echo("No upcoming tournaments to sync field for")
+                    field_alerts: List[Tuple[int, int]] = []
+                    # Overlap the leaderboard fetches; DB writes stay serial.
+                    field_leaderboards = sync.fetch_leaderboards(upcoming)
                     for tournament in upcoming:
-                        new_players, _ = sync.sync_tournament_field(tournament, is_wednesday_evening=is_wednesday_evening)
+                        new_players, _ = sync.sync_tournament_field(
+                            tournament,
+                            is_wednesday_evening=is_wednesday_evening,
+                            alert_collector=field_alerts,
+                            leaderboard_data=field_leaderboards.get(tournament.id),
+                        )
                         total_field = TournamentField.query.filter_by(tournament_id=tournament.id).count()
                         if new_players > 0:
                             click.echo(f"Synced {new_players} new players for {tournament.name} (total: {total_field})")
                         else:
                             click.echo(f"Field up-to-date for {tournament.name} (total: {total_field} players)")
+                    if field_alerts:
+                        # One combined admin email for every short field this pass
+                        try:
+                            from send_reminders import send_admin_field_alerts
+                            if send_admin_field_alerts(field_alerts):
+                                for alert_tournament_id, alert_count in field_alerts:
+                                    alert_tournament = db.session.get(Tournament, alert_tournament_id)
+                                    alert_tournament.field_alert_sent = True
+                                    logger.warning("Sent admin alert for tournament %s - only %s players in field",
+                                                  alert_tournament_id, alert_count)
+                                db.session.commit()
+                        except Exception as e:
+                            logger.error("Failed to send combined admin field alert: %s", e)
 
             if mode in ('live', 'all'):
                 active = get_active_tournaments()
                 if not active:
                     click.echo("No active tournaments for live sync")
+                live_counts = sync.sync_many_live(active)
                 for tournament in active:
-                    updated = sync.sync_live_leaderboard(tournament)
+                    updated = live_counts.get(tournament.id, 0)
                     if updated:
                         click.echo(f"Updated {updated} leaderboard entries with projected earnings for {tournament.name}")
 
@@ -1406,20 +2089,29 @@ def register_sync_commands(app):
                 active = get_active_tournaments()
                 if not active:
                     click.echo("No active tournaments for live+WD sync")
+                # Fetch every leaderboard up front (overlapped) and feed both
+                # passes — the WD check seconds later would hit the same
+                # endpoint again.
+                leaderboards = sync.fetch_leaderboards(active)
                 for tournament in active:
+                    data = leaderboards.get(tournament.id)
+
                     # First update leaderboard
-                    updated = sync.sync_live_leaderboard(tournament)
+                    updated = sync.sync_live_leaderboard(tournament, leaderboard_data=data)
                     if updated:
                         click.echo(f"Updated {updated} leaderboard entries for {tournament.name}")
-        
+
                     # Then check for withdrawals (force=True to bypass free tier guard)
-                    withdrawals = sync.check_withdrawals(tournament, force=True)
+                    critical_wds: List[Dict] = []
+                    withdrawals = sync.check_withdrawals(
+                        tournament, force=True, leaderboard_data=data,
+                        critical_collector=critical_wds,
+                    )
                     if withdrawals:
                         click.echo(f"Withdrawals detected for {tournament.name}: {len(withdrawals)}")
-                        # Log critical R2 withdrawals
-                        for wd in withdrawals:
-                            if wd['wd_before_r2']:
-                                click.echo(f"  ⚠️ {wd['name']} - WD before R2 complete (backup activation possible)")
+                        # Log critical R2 withdrawals (collected during the scan)
+                        for wd in critical_wds:
+                            click.echo(f"  ⚠️ {wd['name']} - WD before R2 complete (backup activation possible)")
 
             if mode in ('withdrawals', 'all'):
                 active = get_active_tournaments()
@@ -1431,30 +2123,33 @@ def register_sync_commands(app):
                         click.echo(f"Withdrawals detected for {tournament.name}: {len(withdrawals)}")
 
             if mode in ('results', 'all'):
-                if sync_mode == 'free' and datetime.now(LEAGUE_TZ).weekday() not in (0, 6):
+                if sync_mode == 'free' and now.weekday() not in (0, 6):
                     click.echo("Free tier: results sync runs Sunday night or Monday morning only")
                 else:
-                    recent = get_recently_completed_tournaments()
+                    recent = get_recently_completed_tournaments(now=now)
                     if not recent:
                         click.echo("No recently completed tournaments to process")
-                    for tournament in recent:
-                        results_count = sync.sync_tournament_results(tournament)
-                        if results_count:
-                            sync.process_tournament_picks(tournament)
-                            # Send results recap email (once per tournament)
-                            tournament = db.session.get(Tournament, tournament.id)
-                            if not tournament.recap_email_sent:
-                                try:
-                                    from send_reminders import send_results_recap_email
-                                    emails_sent = send_results_recap_email(tournament.id)
-                                    tournament.recap_email_sent = True
-                                    db.session.commit()
-                                    if emails_sent > 0:
-                                        logger.info("Sent results recap email to %s users for %s", emails_sent, tournament.name)
-                                    else:
-                                        logger.warning("Results recap attempted but 0 emails sent for %s (check SMTP config)", tournament.name)
-                                except Exception as e:
-                                    logger.error("Failed to send results recap for tournament %s: %s", tournament.id, e)
+                    # Overlap the API fetches across tournaments; DB writes stay serial
+                    results_counts = sync.sync_many_results(recent)
+                    # Resolve picks across all finalized tournaments in one
+                    # transaction (per-tournament savepoints), then send recaps.
+                    ready = [t for t in recent if results_counts.get(t.id, 0)]
+                    sync.process_many_picks(ready)
+                    for tournament in ready:
+                        # Send results recap email (once per tournament)
+                        tournament = db.session.get(Tournament, tournament.id)
+                        if not tournament.recap_email_sent:
+                            try:
+                                from send_reminders import send_results_recap_email
+                                emails_sent = send_results_recap_email(tournament.id)
+                                tournament.recap_email_sent = True
+                                db.session.commit()
+                                if emails_sent > 0:
+                                    logger.info("Sent results recap email to %s users for %s", emails_sent, tournament.name)
+                                else:
+                                    logger.warning("Results recap attempted but 0 emails sent for %s (check SMTP config)", tournament.name)
+                            except Exception as e:
+                                logger.error("Failed to send results recap for tournament %s: %s", tournament.id, e)
 
             if mode in ('earnings', 'all'):
                 # Specifically for finalizing earnings on Monday
@@ -1466,7 +2161,7 @@ def register_sync_commands(app):
                 # indefinitely if the results sync didn't run or failed.
                 stale_active = Tournament.query.filter(
                     Tournament.status == "active",
-                    Tournament.end_date < datetime.now(LEAGUE_TZ) - timedelta(hours=12),
+                    Tournament.end_date < now - timedelta(hours=12),
                     Tournament.results_finalized == False
                 ).order_by(Tournament.end_date.desc()).all()
 
@@ -1523,5 +2218,7 @@ def register_sync_commands(app):
         except Exception:
             logger.exception("sync-run failed")
             exit_code = 1
+        finally:
+            api.close()
 
         sys.exit(exit_code)
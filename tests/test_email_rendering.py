@@ -29,7 +29,7 @@ TOP3 = [
 
 
 def _deadline():
-    return sr.CENTRAL_TZ.localize(datetime(2026, 7, 3, 7, 0))
+    return datetime(2026, 7, 3, 7, 0, tzinfo=sr.CENTRAL_TZ)
 
 
 def _all_member_html():
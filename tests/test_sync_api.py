@@ -1,5 +1,5 @@
 """Tests for sync_api module functions."""
-from sync_api import calculate_projected_earnings, normalize_position
+from sync_api import build_position_histogram, calculate_projected_earnings, normalize_position
 
 
 class TestNormalizePosition:
@@ -34,25 +34,43 @@ class TestNormalizePosition:
             assert isinstance(normalize_position(raw), str)
 
 
+class TestBuildPositionHistogram:
+
+    def test_counts_uppercased_positions(self):
+        hist = build_position_histogram(["T2", "t2", "1", "CUT", ""])
+        assert hist["T2"] == 2
+        assert hist["1"] == 1
+        assert hist["CUT"] == 1
+
+    def test_empty_positions_ignored(self):
+        assert build_position_histogram(["", None, "1"]) == {"1": 1}
+
+
 class TestCalculateProjectedEarnings:
 
     def test_major_multiplier_applied(self):
         """Major tournaments apply 1.5x multiplier to projected earnings."""
-        all_positions = ["1", "2", "3"]
         purse = 22_500_000
 
-        base = calculate_projected_earnings("1", purse, all_positions, is_major=False)
-        major = calculate_projected_earnings("1", purse, all_positions, is_major=True)
+        base = calculate_projected_earnings("1", purse, tie_count=1, is_major=False)
+        major = calculate_projected_earnings("1", purse, tie_count=1, is_major=True)
         assert major == int(base * 1.5)
 
     def test_major_default_is_false(self):
         """is_major defaults to False — existing callers unaffected."""
-        all_positions = ["1"]
-        base = calculate_projected_earnings("1", 10_000_000, all_positions)
-        explicit = calculate_projected_earnings("1", 10_000_000, all_positions, is_major=False)
+        base = calculate_projected_earnings("1", 10_000_000)
+        explicit = calculate_projected_earnings("1", 10_000_000, is_major=False)
         assert base == explicit
 
     def test_major_cut_stays_zero(self):
         """CUT earnings stay 0 regardless of major flag."""
-        result = calculate_projected_earnings("CUT", 22_500_000, ["CUT"], is_major=True)
+        result = calculate_projected_earnings("CUT", 22_500_000, tie_count=1, is_major=True)
         assert result == 0
+
+    def test_tie_splits_combined_payout(self):
+        """Tied players split the summed payout for the positions they span."""
+        purse = 10_000_000
+        solo_2 = calculate_projected_earnings("2", purse, tie_count=1)
+        solo_3 = calculate_projected_earnings("3", purse, tie_count=1)
+        tied = calculate_projected_earnings("T2", purse, tie_count=2)
+        assert tied == (solo_2 + solo_3) // 2